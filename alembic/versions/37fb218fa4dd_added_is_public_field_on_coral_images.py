@@ -28,7 +28,8 @@ def upgrade() -> None:
         ),
     )
 
-    op.execute("UPDATE coral_images SET is_public = TRUE")
+    # the non-null server default already fills existing rows (a metadata-only
+    # change on Postgres 11+), so no backfill UPDATE is needed
 
     op.alter_column("coral_images", "is_public", server_default=None)
     pass
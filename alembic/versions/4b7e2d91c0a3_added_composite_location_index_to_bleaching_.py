@@ -0,0 +1,38 @@
+"""added composite location index to bleaching alerts
+
+Revision ID: 4b7e2d91c0a3
+Revises: 082600a336ce
+Create Date: 2025-10-06 10:12:45.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2d91c0a3'
+down_revision: Union[str, Sequence[str], None] = '082600a336ce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f('ix_bleaching_alerts_latitude'), table_name='bleaching_alerts')
+    op.drop_index(op.f('ix_bleaching_alerts_longitude'), table_name='bleaching_alerts')
+    op.create_index(
+        'idx_bleaching_alerts_on_location',
+        'bleaching_alerts',
+        ['latitude', 'longitude'],
+        unique=False,
+        postgresql_include=['severity_level', 'is_active'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_bleaching_alerts_on_location', table_name='bleaching_alerts')
+    op.create_index(op.f('ix_bleaching_alerts_longitude'), 'bleaching_alerts', ['longitude'], unique=False)
+    op.create_index(op.f('ix_bleaching_alerts_latitude'), 'bleaching_alerts', ['latitude'], unique=False)
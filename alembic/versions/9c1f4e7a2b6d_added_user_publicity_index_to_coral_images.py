@@ -0,0 +1,33 @@
+"""added user publicity index to coral images
+
+Revision ID: 9c1f4e7a2b6d
+Revises: 4b7e2d91c0a3
+Create Date: 2025-10-08 14:27:09.512340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c1f4e7a2b6d'
+down_revision: Union[str, Sequence[str], None] = '4b7e2d91c0a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_coral_images_on_user_id_is_public',
+        'coral_images',
+        ['user_id', 'is_public'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_coral_images_on_user_id_is_public', table_name='coral_images')
@@ -0,0 +1,37 @@
+"""added active most affected index to bleaching alerts
+
+Revision ID: a7c2e9d4f813
+Revises: d3a8b5f1c29e
+Create Date: 2025-10-09 14:12:05.418903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c2e9d4f813'
+down_revision: Union[str, Sequence[str], None] = 'd3a8b5f1c29e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_bleaching_alerts_on_bleached_count_id_active',
+        'bleaching_alerts',
+        [sa.text('bleached_count DESC'), 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_active IS true'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'idx_bleaching_alerts_on_bleached_count_id_active',
+        table_name='bleaching_alerts',
+    )
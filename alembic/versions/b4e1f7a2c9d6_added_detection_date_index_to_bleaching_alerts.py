@@ -0,0 +1,38 @@
+"""added detection date index to bleaching alerts
+
+Revision ID: b4e1f7a2c9d6
+Revises: a7c2e9d4f813
+Create Date: 2025-10-10 09:41:27.365120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e1f7a2c9d6'
+down_revision: Union[str, Sequence[str], None] = 'a7c2e9d4f813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_bleaching_alerts_on_first_detected_at',
+        'bleaching_alerts',
+        ['first_detected_at'],
+        unique=False,
+        postgresql_using='brin',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'idx_bleaching_alerts_on_first_detected_at',
+        table_name='bleaching_alerts',
+        postgresql_using='brin',
+    )
@@ -0,0 +1,35 @@
+"""added keyset pagination index to bleaching alerts
+
+Revision ID: d3a8b5f1c29e
+Revises: 9c1f4e7a2b6d
+Create Date: 2025-10-09 09:41:22.736518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a8b5f1c29e'
+down_revision: Union[str, Sequence[str], None] = '9c1f4e7a2b6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_bleaching_alerts_on_last_updated_at_id',
+        'bleaching_alerts',
+        [sa.text('last_updated_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'idx_bleaching_alerts_on_last_updated_at_id', table_name='bleaching_alerts'
+    )
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.auth import require_role
+from app.core.auth import require_admin, require_super_admin
 from app.db.connection import get_db
 from app.models.users import UserRole
 from app.schemas.user import CreateUser, UserOut, UpdateUser
@@ -17,7 +17,7 @@ router = APIRouter()
 def add_admin(
     payload: CreateUser,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(require_role([UserRole.SUPER_ADMIN])),
+    current_user: UserOut = Depends(require_super_admin),
 ):
     payload.role = UserRole.ADMIN
 
@@ -29,9 +29,7 @@ def update_user_details(
     id: UUID,
     payload: UpdateUser,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_admin),
 ):
     updated_user = user_service.update_user_details_service(
         db, id, payload, current_user
@@ -48,6 +46,6 @@ def update_user_details(
 def delete_admin(
     id: UUID,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(require_role([UserRole.SUPER_ADMIN])),
+    current_user: UserOut = Depends(require_super_admin),
 ):
     return super_admin.remove_admin(db, id, current_user)
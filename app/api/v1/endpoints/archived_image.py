@@ -1,13 +1,12 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 
-from app.core.auth import require_role
+from app.core.auth import require_admin
 from app.db.connection import get_db
-from app.models.users import UserRole
 from app.schemas.archived_image import ArchivedImageOut
 from app.schemas.user import UserOut
 from app.services.archived_image import select_archived_data, delete_archived_data
@@ -19,13 +18,13 @@ LOG_MSG = "Endpoint:"
 
 @router.get("/", response_model=Optional[List[ArchivedImageOut]])
 def get_archived_data(
+    limit: Optional[int] = Query(100, ge=1, le=1000),
+    offset: Optional[int] = Query(0, ge=0),
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_admin),
 ):
     try:
-        return select_archived_data(db)
+        return select_archived_data(db, limit=limit, offset=offset)
     except Exception as e:
         logger.error(f"{LOG_MSG} error getting data: {str(e)}")
         raise HTTPException(
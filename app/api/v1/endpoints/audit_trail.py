@@ -1,13 +1,13 @@
 import logging
 
-from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date, datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from uuid import UUID
 
-from app.core.auth import require_role
+from app.core.auth import require_admin
 from app.db.connection import get_db
-from app.models.users import UserRole
 from app.schemas.audit_trail import AuditTrailOut
 from app.schemas.user import UserOut
 from app.services.audit_trail_service import audit_trail_service
@@ -19,13 +19,34 @@ LOG_MSG = "Endpoint:"
 
 @router.get("/", response_model=List[AuditTrailOut])
 def get_audit(
-    db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.ADMIN, UserRole.SUPER_ADMIN])
+    limit: Optional[int] = Query(100, ge=1, le=1000),
+    offset: Optional[int] = Query(0, ge=0),
+    after_timestamp: Optional[datetime] = Query(
+        None, description="timestamp of the last entry on the previous page"
+    ),
+    after_id: Optional[UUID] = Query(
+        None, description="id of the last entry on the previous page"
     ),
+    db: Session = Depends(get_db),
+    current_user: UserOut = Depends(require_admin),
 ):
+    """
+    Get audit trail entries, newest first. Pages can be fetched by offset, or
+    by passing the timestamp and id of the last entry seen as
+    after_timestamp/after_id.
+    """
+    if (after_timestamp is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_timestamp and after_id must be provided together",
+        )
+
+    cursor = (after_timestamp, after_id) if after_id else None
+
     try:
-        return audit_trail_service.select_all_audit(db)
+        return audit_trail_service.select_all_audit(
+            db, limit=limit, offset=offset, cursor=cursor
+        )
     except Exception as e:
         logger.error(f"{LOG_MSG} error getting audit trails")
         raise HTTPException(
@@ -39,9 +60,7 @@ def get_audit_by_date(
     start_date: date,
     end_date: date,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_admin),
 ):
     try:
         return audit_trail_service.select_audit_by_date(
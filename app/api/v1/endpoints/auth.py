@@ -1,24 +1,31 @@
-import json
 import logging
 import secrets
 
 from datetime import datetime, timedelta, timezone
-from fastapi import APIRouter, Depends, HTTPException, Response, Request, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Response,
+    Request,
+    status,
+)
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from sqlalchemy.orm import Session
 from urllib.parse import quote_plus
 
 from app.core.config import settings
-from app.core.oauth import oauth
+from app.core.oauth import SUPPORTED_PROVIDERS, get_oauth_client
 from app.core.security import Hasher
 from app.crud.user import (
     get_user_by_email,
     create_user,
     create_social_user,
     update_user_details,
+    modify_last_login,
 )
-from app.crud.user import update_user_details, modify_last_login
 from app.crud.verify_token import (
     get_verification_token,
     store_verification_token,
@@ -33,6 +40,7 @@ from app.utils.token import TokenSecurity
 router = APIRouter()
 logger = logging.getLogger(__name__)
 LOG_MSG = "Endpoint:"
+USERINFO_FIELDS = ("email", "given_name", "family_name", "picture")
 
 ENV = settings.ENV
 
@@ -43,6 +51,16 @@ else:
     frontend_url = settings.PROD_FRONTEND_URL
     backend_url = settings.PROD_BACKEND_URL
 
+VERIFY_URL_PREFIX = f"{backend_url}/api/v1/auth/verify-email?token="
+ACCESS_TOKEN_COOKIE = {
+    "key": "access_token",
+    "httponly": True,
+    "secure": True,
+    "samesite": "none",
+    "path": "/",
+    "max_age": 3600,
+}
+
 
 @router.post("/token")
 def login(
@@ -89,21 +107,14 @@ def login(
 
         name = f"{user.first_name} {user.last_name}"
 
-        user_data = {
-            "id": str(user.id),
-            "is_verified": user.is_verified,
-            "role": user.role,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-        }
+        user_data = user.to_token_claims()
 
         modify_last_login(db, user.id)
 
         access_token = TokenSecurity.create_access_token(
             user.email, user_data=user_data
         )
-        response = JSONResponse(
+        response = ORJSONResponse(
             content={
                 "message": "login successful",
                 "access_token": access_token,
@@ -115,17 +126,11 @@ def login(
             }
         )
 
-        response.set_cookie(
-            key="access_token",
-            value=access_token,
-            httponly=True,
-            secure=True,
-            samesite="none",
-            path="/",
-            max_age=3600,
-        )
+        response.set_cookie(value=access_token, **ACCESS_TOKEN_COOKIE)
 
         return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"{LOG_MSG} error upon signin: {str(e)}")
         raise HTTPException(
@@ -134,7 +139,7 @@ def login(
 
 
 @router.post("/refresh")
-async def refresh_token(request: Request, db: Session = Depends(get_db)):
+def refresh_token(request: Request, db: Session = Depends(get_db)):
     refresh_token = request.cookies.get("refresh_token")
     if not refresh_token:
         raise HTTPException(
@@ -153,14 +158,7 @@ async def refresh_token(request: Request, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND, detail="user not found"
         )
 
-    user_data = {
-        "id": user.id,
-        "is_verified": user.is_verified,
-        "role": user.role,
-        "email": user.email,
-        "first_name": user.first_name,
-        "last_name": user.last_name,
-    }
+    user_data = user.to_token_claims()
 
     new_access_token = TokenSecurity.create_access_token(
         subject=user.email, user_data=user_data
@@ -170,12 +168,17 @@ async def refresh_token(request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("/signup", response_model=Token)
-async def signup(user_data: CreateUser, db: Session = Depends(get_db)):
+async def signup(
+    user_data: CreateUser,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     """
     Register a new user with the provided details, then return an access token for immediate login.
 
     <b>Args</b>:
         user_data (user.CreateUser): The new user's registration data, including name, email, password, age, and agreement to terms.
+        background_tasks (BackgroundTasks): Runs the verification email after the response is sent.
         db (Session): Database session dependency.
 
     <b>Returns</b>:
@@ -186,18 +189,16 @@ async def signup(user_data: CreateUser, db: Session = Depends(get_db)):
     """
 
     try:
-        existing_user = get_user_by_email(db, user_data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="account already exists"
-            )
-
-        hashed_pwd = Hasher.hash_password(user_data.password)
+        hashed_pwd = await Hasher.hash_password_async(user_data.password)
         user = create_user(
             db,
             payload=user_data,
             hashed_password=hashed_pwd,
         )
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="account already exists"
+            )
 
         verification_token = secrets.token_urlsafe(32)
         expires_at = datetime.now(timezone.utc) + timedelta(
@@ -211,18 +212,20 @@ async def signup(user_data: CreateUser, db: Session = Depends(get_db)):
                 detail="Failed to store verification token",
             )
 
-        verification_url = (
-            f"{backend_url}/api/v1/auth/verify-email?token={verification_token}"
-        )
+        verification_url = VERIFY_URL_PREFIX + verification_token
 
         name = f"{user_data.first_name} {user_data.last_name or ''}".strip()
-        await send_verification_email(
-            user_data.email, name, verification_url, expires_at
+        background_tasks.add_task(
+            send_verification_email,
+            user_data.email,
+            name,
+            verification_url,
+            expires_at,
         )
 
         # auto login after signup
         access_token = TokenSecurity.create_access_token(user.email)
-        response = JSONResponse(
+        response = ORJSONResponse(
             content={
                 "message": "login successful",
                 "access_token": access_token,
@@ -230,16 +233,12 @@ async def signup(user_data: CreateUser, db: Session = Depends(get_db)):
                 "email": user.email,
             }
         )
-        response.set_cookie(
-            key="access_token",
-            value=access_token,
-            httponly=True,
-            secure=True,
-            samesite="none",
-        )
+        response.set_cookie(value=access_token, **ACCESS_TOKEN_COOKIE)
         return response
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"{LOG_MSG} error upon signin: {str(e)}")
+        logger.error(f"{LOG_MSG} error upon signup: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="signup failed"
         )
@@ -261,12 +260,12 @@ async def social_auth(provider: str, request: Request):
         HTTPException: If the provider is not supported.
     """
 
-    if provider not in ["google"]:
+    if provider not in SUPPORTED_PROVIDERS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="unsupported provider"
         )
 
-    client = oauth.create_client(provider)
+    client = get_oauth_client(provider)
     redirect_uri = request.url_for("social_callback", provider=provider)
     return await client.authorize_redirect(request, redirect_uri)
 
@@ -291,7 +290,12 @@ async def social_callback(
                        or user information (like email) is not provided.
     """
 
-    client = oauth.create_client(provider)
+    if provider not in SUPPORTED_PROVIDERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="unsupported provider"
+        )
+
+    client = get_oauth_client(provider)
 
     try:
         token = await client.authorize_access_token(request)
@@ -304,10 +308,8 @@ async def social_callback(
                 )
                 user_info = response.json()
 
-        email = user_info.get("email")
-        first_name = user_info.get("given_name")
-        last_name = user_info.get("family_name")
-        profile = user_info.get("picture")
+        # family_name/picture are optional claims, so missing keys map to None
+        email, first_name, last_name, profile = map(user_info.get, USERINFO_FIELDS)
         provider_id = user_info.get("sub") or user_info.get("id")
 
         if not email:
@@ -345,14 +347,7 @@ async def social_callback(
                 profile=profile,
             )
 
-        user_data = {
-            "id": str(user.id),
-            "is_verified": user.is_verified,
-            "role": user.role,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-        }
+        user_data = user.to_token_claims()
 
         access_token = TokenSecurity.create_access_token(
             user.email, user_data=user_data
@@ -375,6 +370,8 @@ async def social_callback(
         )
 
         return response
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
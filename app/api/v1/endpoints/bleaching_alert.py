@@ -1,22 +1,26 @@
 import logging
+import traceback
 
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 
-from app.core.auth import require_role
+from app.core.auth import require_admin
 from app.db.connection import get_db
-from app.models.users import UserRole
+from app.models.analysis_results import AnalysisResult
+from app.models.coral_images import CoralImages
 from app.schemas.bleaching_alert import (
     BleachingAlertOut,
-    CreateBleachingAlert,
-    UpdateBleachingAlert,
+    BleachingAlertListAdapter,
     BleachingAlertSummary,
     AlertFilterParams,
 )
 from app.schemas.user import UserOut
 from app.services.bleaching_alert_service import bleaching_alert_service
+from app.utils.responses import json_list_response
 from app.crud.bleaching_alert import (
     get_alert_by_id,
     get_all_alerts,
@@ -104,11 +108,34 @@ def get_raw_bleaching_data(db: Session = Depends(get_db)):
     No authentication required for testing
     """
     try:
-        from app.models.coral_images import CoralImages
-        from app.models.analysis_results import AnalysisResult
+        has_location = and_(
+            CoralImages.latitude.is_not(None), CoralImages.longitude.is_not(None)
+        )
+        has_analysis = AnalysisResult.classification_labels.is_not(None)
+        potentially_bleached = and_(
+            AnalysisResult.classification_labels.is_not(None),
+            AnalysisResult.classification_labels != "",
+            AnalysisResult.bleaching_percentage.is_not(None),
+        )
+
+        def joined(*columns):
+            return (
+                select(*columns)
+                .select_from(CoralImages)
+                .outerjoin(AnalysisResult, CoralImages.id == AnalysisResult.image_id)
+            )
+
+        # Count every category in a single pass over the joined rows
+        counts = db.execute(
+            joined(
+                func.count().label("total"),
+                func.count().filter(has_location).label("with_location"),
+                func.count().filter(has_analysis).label("with_analysis"),
+                func.count().filter(potentially_bleached).label("potentially_bleached"),
+            )
+        ).one()
 
-        # Get ALL coral images with analysis results
-        query = db.query(
+        sample_columns = (
             CoralImages.id,
             CoralImages.latitude,
             CoralImages.longitude,
@@ -116,77 +143,59 @@ def get_raw_bleaching_data(db: Session = Depends(get_db)):
             AnalysisResult.bleaching_percentage,
             AnalysisResult.classification_labels,
             AnalysisResult.confidence_score,
-        ).outerjoin(AnalysisResult, CoralImages.id == AnalysisResult.image_id)
-
-        all_corals = query.all()
-
-        # Categorize the data
-        with_location = []
-        without_location = []
-        with_analysis = []
-        without_analysis = []
-        potentially_bleached = []
-
-        for coral in all_corals:
-            coral_data = {
-                "id": str(coral.id),
-                "latitude": coral.latitude,
-                "longitude": coral.longitude,
-                "is_public": coral.is_public,
-                "bleaching_percentage": coral.bleaching_percentage,
-                "classification": coral.classification_labels,
-                "confidence": coral.confidence_score,
-            }
-
-            # Check location
-            if coral.latitude is not None and coral.longitude is not None:
-                with_location.append(coral_data)
-            else:
-                without_location.append(coral_data)
-
-            # Check analysis
-            if coral.classification_labels is not None:
-                with_analysis.append(coral_data)
-            else:
-                without_analysis.append(coral_data)
-
-            # Check if potentially bleached
-            if coral.classification_labels and coral.bleaching_percentage is not None:
-                potentially_bleached.append(coral_data)
+        )
+
+        def sample(condition):
+            rows = db.execute(joined(*sample_columns).where(condition).limit(5)).all()
+            return [
+                {
+                    "id": str(coral.id),
+                    "latitude": coral.latitude,
+                    "longitude": coral.longitude,
+                    "is_public": coral.is_public,
+                    "bleaching_percentage": coral.bleaching_percentage,
+                    "classification": coral.classification_labels,
+                    "confidence": coral.confidence_score,
+                }
+                for coral in rows
+            ]
+
+        all_classifications = db.execute(
+            select(AnalysisResult.classification_labels)
+            .where(
+                AnalysisResult.classification_labels.is_not(None),
+                AnalysisResult.classification_labels != "",
+            )
+            .distinct()
+        ).scalars().all()
+
+        # Only analysis columns are read here, so skip the coral_images join
+        bleaching_percentages = db.execute(
+            select(AnalysisResult.bleaching_percentage)
+            .where(AnalysisResult.bleaching_percentage.is_not(None))
+            .limit(10)
+        ).scalars().all()
 
         return {
             "summary": {
-                "total_corals": len(all_corals),
-                "with_location": len(with_location),
-                "without_location": len(without_location),
-                "with_analysis": len(with_analysis),
-                "without_analysis": len(without_analysis),
-                "potentially_bleached": len(potentially_bleached),
+                "total_corals": counts.total,
+                "with_location": counts.with_location,
+                "without_location": counts.total - counts.with_location,
+                "with_analysis": counts.with_analysis,
+                "without_analysis": counts.total - counts.with_analysis,
+                "potentially_bleached": counts.potentially_bleached,
             },
             "sample_data": {
-                "with_location": with_location[:5],
-                "with_analysis": with_analysis[:5],
-                "potentially_bleached": potentially_bleached[:5],
+                "with_location": sample(has_location),
+                "with_analysis": sample(has_analysis),
+                "potentially_bleached": sample(potentially_bleached),
             },
-            "all_classifications": list(
-                set(
-                    [
-                        c.classification_labels
-                        for c in all_corals
-                        if c.classification_labels
-                    ]
-                )
-            ),
-            "bleaching_percentages": [
-                c.bleaching_percentage
-                for c in all_corals
-                if c.bleaching_percentage is not None
-            ][:10],
+            "all_classifications": list(all_classifications),
+            "bleaching_percentages": list(bleaching_percentages),
         }
 
     except Exception as e:
         logger.error(f"{LOG_MSG} error getting raw data: {str(e)}")
-        import traceback
 
         return {"error": str(e), "traceback": traceback.format_exc()}
 
@@ -200,12 +209,27 @@ def get_alerts(
     ),
     limit: Optional[int] = Query(100, ge=1, le=1000),
     offset: Optional[int] = Query(0, ge=0),
+    after_updated_at: Optional[datetime] = Query(
+        None, description="last_updated_at of the last alert on the previous page"
+    ),
+    after_id: Optional[UUID] = Query(
+        None, description="id of the last alert on the previous page"
+    ),
     db: Session = Depends(get_db),
 ):
     """
     Get all bleaching alerts with optional filtering.
-    Public endpoint.
+    Public endpoint. Pages can be fetched by offset, or by passing the
+    last_updated_at and id of the last alert seen as after_updated_at/after_id.
     """
+    if (after_updated_at is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_updated_at and after_id must be provided together",
+        )
+
+    cursor = (after_updated_at, after_id) if after_id else None
+
     try:
         filters = AlertFilterParams(
             severity_level=severity_level,
@@ -213,8 +237,10 @@ def get_alerts(
             min_bleached_count=min_bleached_count,
         )
 
-        alerts = get_all_alerts(db, filters=filters, limit=limit, offset=offset)
-        return [BleachingAlertOut.model_validate(alert) for alert in alerts]
+        alerts = get_all_alerts(
+            db, filters=filters, limit=limit, offset=offset, cursor=cursor
+        )
+        return json_list_response(BleachingAlertListAdapter, alerts)
     except Exception as e:
         logger.error(f"{LOG_MSG} error getting alerts: {str(e)}")
         raise HTTPException(
@@ -231,7 +257,7 @@ def get_active_alerts_endpoint(db: Session = Depends(get_db)):
     """
     try:
         alerts = get_active_alerts(db)
-        return [BleachingAlertOut.model_validate(alert) for alert in alerts]
+        return json_list_response(BleachingAlertListAdapter, alerts)
     except Exception as e:
         logger.error(f"{LOG_MSG} error getting active alerts: {str(e)}")
         raise HTTPException(
@@ -283,9 +309,7 @@ def get_alert(alert_id: UUID, db: Session = Depends(get_db)):
 def resolve_alert_endpoint(
     alert_id: UUID,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_admin),
 ):
     """
     Mark an alert as resolved.
@@ -295,7 +319,8 @@ def resolve_alert_endpoint(
         success = resolve_alert(db, alert_id)
         if not success:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Alert not found or already resolved",
             )
         return {"message": "Alert resolved successfully", "alert_id": str(alert_id)}
     except HTTPException:
@@ -312,9 +337,7 @@ def resolve_alert_endpoint(
 def delete_alert_endpoint(
     alert_id: UUID,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_admin),
 ):
     """
     Delete an alert.
@@ -7,17 +7,21 @@ from fastapi import (
     File,
     HTTPException,
     Depends,
+    Query,
     status,
 )
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 
-from app.core.auth import require_role
-from app.core.supabase_client import supabase
+from app.core.auth import require_user
 from app.db.connection import get_db
-from app.models.users import UserRole
-from app.schemas.coral_image import CoralImageOut, CoralImageLocation, UpdateCoralImage
+from app.schemas.coral_image import (
+    CoralImageOut,
+    CoralImageListAdapter,
+    CoralImageLocation,
+    UpdateCoralImage,
+)
 from app.schemas.user import UserOut
 from app.schemas.settings import Settings
 from app.services.coral_image_service import (
@@ -39,12 +43,13 @@ from app.services.image_processing import (
     validate_image,
     optimize_for_storage,
 )
+from app.utils.responses import json_list_response
 
 router = APIRouter()
 
 
 @router.post("/")
-async def analyze_coral_image(
+def analyze_coral_image(
     name: Optional[str] = Form(None),
     latitude: Optional[float] = Form(None),
     longitude: Optional[float] = Form(None),
@@ -53,9 +58,7 @@ async def analyze_coral_image(
     observation_date: Optional[datetime] = Form(None),
     is_public: Optional[bool] = Form(None),
     file: UploadFile = File(...),
-    current_user: UserOut = Depends(
-        require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -97,28 +100,35 @@ async def analyze_coral_image(
 
 
 @router.get("/", response_model=List[CoralImageOut])
-def get_all_images(db: Session = Depends(get_db)):
+def get_all_images(
+    limit: Optional[int] = Query(100, ge=1, le=1000),
+    offset: Optional[int] = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
     """
-    Retrieve a list of all coral images from the database.
+    Retrieve a page of coral images from the database, newest first.
 
     <b>Args</b>:
+        limit (int): Maximum number of images to return.
+        offset (int): Number of images to skip.
         db (Session): Database session dependency.
 
     <b>Returns</b>:
         List[CoralImageOut]: A list of coral image data transfer objects.
     """
+    images = get_all_images_service(db, limit=limit, offset=offset)
 
-    return get_all_images_service(db)
+    return json_list_response(CoralImageListAdapter, images)
 
 
 @router.get("/coral-data/", response_model=List[CoralImageOut])
 def get_coral_data(db: Session = Depends(get_db)):
-    return get_all_coral_data(db)
+    return json_list_response(CoralImageListAdapter, get_all_coral_data(db))
 
 
 @router.get("/public-coral-data/", response_model=List[CoralImageOut])
 def get_public_coral(db: Session = Depends(get_db)):
-    return get_public_coral_data(db)
+    return json_list_response(CoralImageListAdapter, get_public_coral_data(db))
 
 
 @router.get("/coral-locations/", response_model=List[CoralImageLocation])
@@ -130,9 +140,7 @@ def get_locations(db: Session = Depends(get_db)):
 def get_user_images(
     # id: UUID,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_user),
 ):
     """
     Retrieve a list of coral images belonging to the currently authenticated user.
@@ -194,9 +202,7 @@ def change_all_user_image_publicity(
 def delete_single_image(
     id: UUID,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_user),
 ):
     success = delete_single_image_service(db, id, current_user)
     if not success:
@@ -210,9 +216,7 @@ def delete_single_image(
 def delete_multiple_image(
     ids: List[UUID] = Body(...),
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_user),
 ):
     deleted_count = delete_multiple_images_service(db, ids, current_user)
     return {"deleted_count": deleted_count}
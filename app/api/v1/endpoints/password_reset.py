@@ -2,16 +2,8 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.core.auth import get_current_user
 from app.db.connection import get_db
-from app.schemas.password_reset import (
-    GetToken,
-    ForgotPasswordRequest,
-    PasswordChangeRequest,
-    ResetPasswordRequest,
-)
-from app.schemas.password_reset import RequestResponse
-from app.schemas.user import UserOut
+from app.schemas.password_reset import ForgotPasswordRequest, ResetPasswordRequest
 from app.services.password_reset_service import password_reset_service
 
 router = APIRouter()
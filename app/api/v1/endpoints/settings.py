@@ -4,13 +4,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 
+from app.crud.coral_images import count_user_images_by_publicity
 from app.db.connection import get_db
 from app.schemas.settings import Settings
 from app.services.coral_image_service import (
     change_all_user_coral_image_publicity_status,
-    get_all_images_by_user_service,
 )
-from app.services.user_service import user_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -18,18 +17,21 @@ logger = logging.getLogger(__name__)
 
 @router.get("/{id}")
 def get_settings(id: UUID, db: Session = Depends(get_db)):
-    images = get_all_images_by_user_service(db, id)
+    counts = count_user_images_by_publicity(db, id)
+    if counts is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="failed to get user settings",
+        )
 
-    if not images:
+    is_public_true, total = counts
+    if not total:
         logger.warning(f"no image posted by the user with given id is found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="no images found"
         )
 
-    is_public_true = sum(img.is_public for img in images)
-    is_public_false = len(images) - is_public_true
-
-    majority_is_public = is_public_true > is_public_false
+    majority_is_public = is_public_true * 2 > total
 
     return {"is_public": majority_is_public}
 
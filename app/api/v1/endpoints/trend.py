@@ -1,19 +1,30 @@
 import logging
+import orjson
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
+from app.crud.coral_images import cache_trend_result, get_cached_trend_result
 from app.db.connection import get_db
 from app.services.trend_service import trend_result
+from app.utils.responses import conditional_json_response, etag_for
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
 @router.get("/")
-def get_data_trends(db: Session = Depends(get_db)):
+def get_data_trends(request: Request, db: Session = Depends(get_db)):
     try:
-        return trend_result(db)
+        cached = get_cached_trend_result()
+        if cached is None:
+            content = orjson.dumps(trend_result(db))
+            cached = (etag_for(content), content)
+            cache_trend_result(cached)
+
+        return conditional_json_response(request, *cached)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Endpoint: error getting trend result data: {str(e)}")
         raise HTTPException(
@@ -1,17 +1,25 @@
 import logging
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from app.core.auth import require_role
+from app.core.auth import require_user
 from app.db.connection import get_db
-from app.models.users import UserRole
 from app.schemas.password_reset import PasswordChangeRequest
-from app.schemas.user import CreateUser, UpdateUser, UserOut
+from app.schemas.user import CreateUser, UpdateUser, UserListAdapter, UserOut
 from app.services.image_processing import validate_image, optimize_for_storage
 from app.services.user_service import user_service
+from app.utils.responses import json_list_response, next_page_headers
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -82,32 +90,45 @@ def get_user_by_id(id: UUID, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=List[UserOut])
-def get_all_users(db: Session = Depends(get_db)):
+def get_all_users(
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="page size; all users when omitted"
+    ),
+    after_id: Optional[UUID] = Query(
+        None, description="id of the last user on the previous page"
+    ),
+    db: Session = Depends(get_db),
+):
     """
-    Retrieves all users from the database.
+    Retrieves users ordered by id, all of them unless a limit is given.
 
     <b>Args</b>:
+        limit (int): Maximum number of users to return.
+        after_id (UUID): Id of the last user on the previous page, to fetch the next one.
         db (Session): Database session dependency.
 
     <b>Returns</b>:
-        List[UserOut]: A list of all users.
+        List[UserOut]: A page of users. A full page carries the next after_id
+        in the X-Next-After-Id header.
     """
 
-    return user_service.get_all_users_service(db)
+    users = user_service.get_all_users_service(db, limit=limit, after_id=after_id)
+    return json_list_response(
+        UserListAdapter, users, headers=next_page_headers(users, limit)
+    )
 
 
-@router.get("/admin/")
+@router.get("/admin/", response_model=List[UserOut])
 def get_all_admin(db: Session = Depends(get_db)):
-    return user_service.get_all_admin_service(db)
+    admins = user_service.get_all_admin_service(db)
+    return json_list_response(UserListAdapter, admins)
 
 
 @router.patch("/me/profile-details", response_model=UserOut)
 def update_user_details(
     payload: UpdateUser,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_user),
 ):
     """
     Updates an existing user's information by ID.
@@ -125,7 +146,7 @@ def update_user_details(
     """
 
     updated_user = user_service.update_user_details_service(
-        db, current_user.id, payload, current_user
+        db, current_user.id, payload, current_user, actor_id=current_user.id
     )
 
     if not updated_user:
@@ -139,16 +160,14 @@ def update_user_details(
 def update_user_profile(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_user),
 ):
     validate_image(file)
     optimized = optimize_for_storage(file)
 
     try:
         return user_service.update_user_profile(
-            db, current_user.id, optimized, file.filename, current_user
+            db, current_user.id, optimized, current_user
         )
     except Exception as e:
         logger.error(f"API: error uploading image to supabase: {str(e)}")
@@ -162,9 +181,7 @@ def update_user_profile(
 def delete_user(
     id: UUID,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_user),
 ):
     """
     Deletes a user by their UUID.
@@ -194,16 +211,14 @@ async def update_password(
     id: UUID,
     payload: PasswordChangeRequest,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-    ),
+    current_user: UserOut = Depends(require_user),
 ):
     """
     Updates the password of the user with the given ID.
 
     This endpoint allows an authenticated user to change their own password.
-    It verifies that the authenticated user matches the provided user ID,
-    then delegates the password change to the service layer.
+    Requests for any other user's ID are rejected; the service additionally
+    scopes the update to the authenticated user's ID in SQL.
 
     <b>Parameters</b>:
         id (UUID): The ID of the user whose password is to be changed.
@@ -216,8 +231,8 @@ async def update_password(
 
     <b>Raises</b>:
         HTTPException:
-            - 403 Forbidden if the authenticated user ID does not match the path ID.
-            - 400 Bad Request if the password change fails in the service layer.
+            - 400 Bad Request if the old password is incorrect or the change fails.
+            - 403 Forbidden if the ID does not belong to the current user.
     """
 
     if current_user.id != id:
@@ -226,7 +241,7 @@ async def update_password(
         )
 
     update_password = await user_service.change_password_service(
-        db, current_user.id, payload, current_user
+        db, id, payload, current_user
     )
     if not update_password:
         raise HTTPException(
@@ -1,93 +1,132 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 from uuid import UUID
 
-from app.core.auth import require_role
-from app.crud.user import get_all_admin
+from app.core.auth import require_admin
 from app.db.connection import get_db
-from app.models.users import UserRole
+from app.jobs.notify_admins import notify_admins_of_update
 from app.schemas.website_content import (
     WebsiteContentCreate,
     WebsiteContentUpdate,
     WebsiteContentOut,
+    WebsiteContentAdapter,
+    WebsiteContentListAdapter,
 )
 from app.schemas.user import UserOut
-from app.services.email_service import send_web_update_email_to_admins
 from app.services.website_content import website_content_service
+from app.utils.responses import (
+    conditional_json_response,
+    etag_for,
+    next_page_headers,
+)
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+LOG_MSG = "Endpoint:"
+
+
+def content_response(
+    request: Request,
+    adapter: TypeAdapter,
+    load: Callable[[], Any],
+    limit: Optional[int] = None,
+):
+    """
+    Encode the loaded rows and tag them with an ETag derived from the body,
+    answering 304 when the client's ETag still matches. The tag is computed
+    from the current rows on every request, so it is the same in every worker
+    and changes as soon as a write commits. With a limit, a full page also
+    carries the next after_id cursor header.
+    """
+    rows = load()
+    content = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+    return conditional_json_response(
+        request, etag_for(content), content, next_page_headers(rows, limit)
+    )
 
 
 @router.get("/id/{id}", response_model=WebsiteContentOut)
-def select(id: UUID, db: Session = Depends(get_db)):
-    return website_content_service.get_content(db, id)
+def select(id: UUID, request: Request, db: Session = Depends(get_db)):
+    return content_response(
+        request,
+        WebsiteContentAdapter,
+        lambda: website_content_service.get_content(db, id),
+    )
 
 
 @router.get("/", response_model=List[WebsiteContentOut])
-def select_all(db: Session = Depends(get_db)):
-    return website_content_service.get_all_contents(db)
+def select_all(
+    request: Request,
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="page size; all contents when omitted"
+    ),
+    after_id: Optional[UUID] = Query(
+        None, description="id of the last content on the previous page"
+    ),
+    db: Session = Depends(get_db),
+):
+    return content_response(
+        request,
+        WebsiteContentListAdapter,
+        lambda: website_content_service.get_all_contents(
+            db, limit=limit, after_id=after_id
+        ),
+        limit=limit,
+    )
 
 
 @router.get("/section/{section}", response_model=Optional[List[WebsiteContentOut]])
-def select_content_by_section(section: str, db: Session = Depends(get_db)):
-    content = website_content_service.get_content_by_section(db, section)
-    if content is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="no content found"
-        )
-    return content
+def select_content_by_section(
+    section: str, request: Request, db: Session = Depends(get_db)
+):
+    def load():
+        content = website_content_service.get_content_by_section(db, section)
+        if content is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="no content found"
+            )
+        return content
+
+    return content_response(request, WebsiteContentListAdapter, load)
 
 
 @router.post("/")
 def store(
     payload: WebsiteContentCreate,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.SUPER_ADMIN, UserRole.ADMIN]),
-    ),
+    current_user: UserOut = Depends(require_admin),
 ):
     return website_content_service.insert_content(db, payload, current_user)
 
 
 @router.patch("/id/{id}")
-async def update(
+def update(
     id: UUID,
     payload: WebsiteContentUpdate,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.SUPER_ADMIN, UserRole.ADMIN])
-    ),
+    current_user: UserOut = Depends(require_admin),
 ):
-    all_admin = get_all_admin(db)
-    admin_list = all_admin if isinstance(all_admin, list) else list(all_admin)
+    result = website_content_service.update_content(db, id, payload, current_user)
 
-    if not admin_list:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="no admin found"
-        )
+    # the admin lookup and email fan-out run on the celery worker; the update
+    # is already committed, so a broker outage must not fail the request
+    try:
+        notify_admins_of_update.delay(str(id), payload.title, payload.content)
+    except Exception as e:
+        logger.error(f"{LOG_MSG} error queueing admin update emails: {str(e)}")
 
-    for admin in admin_list:
-        name = f"{admin.first_name} {admin.last_name}"
-        success = await send_web_update_email_to_admins(
-            emails=admin.email, name=name, title=payload.title, content=payload.content
-        )
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="error sending email to {admin.email}",
-            )
-
-    return website_content_service.update_content(db, id, payload, current_user)
+    return result
 
 
 @router.delete("/id/{id}")
 def delete(
     id: UUID,
     db: Session = Depends(get_db),
-    current_user: UserOut = Depends(
-        require_role([UserRole.SUPER_ADMIN, UserRole.ADMIN])
-    ),
+    current_user: UserOut = Depends(require_admin),
 ):
     return website_content_service.remove_content(db, id, current_user)
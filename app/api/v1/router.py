@@ -1,4 +1,6 @@
 from fastapi import APIRouter
+
+from app.core.config import settings as app_settings
 from app.api.v1.endpoints import (
     admin,
     archived_image,
@@ -35,4 +37,10 @@ api_router.include_router(trend.router, prefix="/trends", tags=["Trends"])
 api_router.include_router(
     website_content.router, prefix="/admin/website-content", tags=["Website Content"]
 )
-api_router.include_router(dev_test.router, prefix="/dev", tags=["Developer Routes"])
+
+# developer routes are only mounted locally so production does not route
+# (or expose) the unauthenticated test endpoints
+if app_settings.ENV == "development":
+    api_router.include_router(
+        dev_test.router, prefix="/dev", tags=["Developer Routes"]
+    )
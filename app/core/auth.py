@@ -13,7 +13,11 @@ from uuid import UUID
 
 from app.db.connection import get_db
 from app.core.config import settings
-from app.crud.user import get_user_by_email
+from app.crud.user import (
+    cache_session_user,
+    get_cached_session_user,
+    get_user_out_by_email_cached,
+)
 from app.models.users import UserRole
 from app.schemas.user import UserOut
 from app.utils.token import TokenSecurity
@@ -50,7 +54,7 @@ BACKEND_DEBUG = False
 
 if not BACKEND_DEBUG:
     # local auth
-    async def get_current_user(
+    def get_current_user(
         request: Request, db: Session = Depends(get_db)
     ) -> UserOut:
         token = request.cookies.get("access_token")
@@ -60,30 +64,35 @@ if not BACKEND_DEBUG:
                 token = auth_header.split(" ")[1]
 
         if not token:
-            print("No token found in cookies or headers")
+            logger.debug("no token found in cookies or headers")
             raise credentials_exception
 
-        print(f"Token found: {token[:10]}...")
+        logger.debug("token found in request")
+
+        user = get_cached_session_user(token)
+        if user is not None:
+            return user
 
         payload = TokenSecurity.decode_access_token(token)
         if payload is None:
-            print("Token decode failed")
+            logger.debug("token decode failed")
             raise credentials_exception
 
         email: str = payload.get("sub")
         if email is None:
-            print("Email not found")
+            logger.debug("email not found in token")
             raise credentials_exception
 
-        user = get_user_by_email(db, email)
+        user = get_user_out_by_email_cached(db, email)
         if user is None:
-            print("User not found")
+            logger.debug("user not found")
             raise credentials_exception
 
         if user.is_verified != payload.get("is_verified"):
-            print("User not verified")
+            logger.debug("user verification status does not match token")
             raise credentials_exception
 
+        cache_session_user(token, user, payload["exp"])
         return user
 
     # supabase auth
@@ -116,7 +125,7 @@ if not BACKEND_DEBUG:
 
 else:
 
-    async def get_current_user(
+    def get_current_user(
         token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
     ) -> UserOut:
         payload = TokenSecurity.decode_access_token(token)
@@ -128,7 +137,7 @@ else:
         if email is None:
             raise credentials_exception
 
-        user = get_user_by_email(db, email)
+        user = get_user_out_by_email_cached(db, email)
         if user is None:
             raise credentials_exception
 
@@ -136,6 +145,8 @@ else:
 
 
 def require_role(allowed_roles: List[UserRole]):
+    allowed_roles = frozenset(allowed_roles)
+
     def role_checker(current_user: UserOut = Depends(get_current_user)):
         if current_user.role not in allowed_roles:
             raise HTTPException(
@@ -145,3 +156,10 @@ def require_role(allowed_roles: List[UserRole]):
         return current_user
 
     return role_checker
+
+
+# shared role dependencies: reusing one callable per role set lets FastAPI's
+# per-request dependency cache resolve each check (and get_current_user) once
+require_user = require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
+require_admin = require_role([UserRole.ADMIN, UserRole.SUPER_ADMIN])
+require_super_admin = require_role([UserRole.SUPER_ADMIN])
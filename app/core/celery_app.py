@@ -1,9 +1,30 @@
 from celery import Celery
+from celery.schedules import crontab
 from app.core.config import settings
 
 
+# task modules are listed explicitly: autodiscover_tasks(["app.jobs"]) only
+# looks for an app.jobs.tasks module, so the worker never registered them
 celery_app = Celery(
-    __name__, broker="redis://redis:6379/0", backend="redis://redis:6379/0"
+    __name__,
+    broker="redis://redis:6379/0",
+    backend="redis://redis:6379/0",
+    include=[
+        "app.jobs.cleanup_reset_tokens",
+        "app.jobs.deactivate_users",
+        "app.jobs.notify_admins",
+    ],
 )
 
-celery_app.autodiscover_tasks(["app.jobs"])
+# set here rather than in a separate module so that beat, which only loads
+# app.core.celery_app, actually sees the schedule
+celery_app.conf.beat_schedule = {
+    "daily-inactive-deactication": {
+        "task": "app.jobs.deactivate_users.deactivate_inactive_users",
+        "schedule": crontab(hour=0, minute=0),
+    },
+    "expired-reset-token-cleanup": {
+        "task": "app.jobs.cleanup_reset_tokens.cleanup_expired_reset_tokens",
+        "schedule": crontab(minute="*/10"),
+    },
+}
@@ -1,14 +1,22 @@
-from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional, Union
 
-# load .env from the project root
+# .env in the project root, read by pydantic-settings itself
 env_path = Path(__file__).resolve().parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
 
 
 class Settings(BaseSettings):
+    # the .env may carry keys for other tools (docker, alembic), hence ignore
+    model_config = SettingsConfigDict(
+        env_file=env_path,
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
+    )
+
     ENV: str
     APP_NAME: str
     FRONTEND_URL: str
@@ -29,6 +37,8 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
     SESSION_SECRET: str
+    # cost factor for new password hashes; existing hashes keep their own
+    BCRYPT_ROUNDS: int = 12
 
     RESET_TOKEN_EXPIRE_MINUTES: int = 30
     VERIFICATION_TOKEN_EXPIRE_HOURS: int = 60
@@ -64,9 +74,23 @@ class Settings(BaseSettings):
     REDIS_URL: str
 
     TRANSACTION_POOLER: str
-
-    class config:
-        case_sensitive = True
-
-
-settings = Settings()
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    # hand connection pooling entirely to the external pooler (NullPool)
+    DB_USE_NULL_POOL: bool = False
+    DB_ECHO: Union[bool, Literal["debug"]] = False
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # sync (def) endpoints run on the anyio threadpool, so this caps how many
+    # requests can wait on the database at once; anyio's default is 40
+    THREADPOOL_SIZE: int = 40
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    # the .env parse and validation run once per process
+    return Settings()
+
+
+settings = get_settings()
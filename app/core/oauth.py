@@ -1,21 +1,30 @@
 from authlib.integrations.starlette_client import OAuth
+from functools import lru_cache
 from starlette.middleware.sessions import SessionMiddleware
-from starlette.config import Config
 
+from app.core.config import get_settings
 
-config = Config(".env")
-oauth = OAuth(config)
+# credentials come from the shared settings instead of a second .env parse
+oauth = OAuth()
 
 OAUTH_ENABLED = True
+SUPPORTED_PROVIDERS = frozenset({"google"})
 
 try:
     oauth.register(
         name="google",
-        client_id=config("GOOGLE_CLIENT_ID"),
-        client_secret=config("GOOGLE_CLIENT_SECRET"),
+        client_id=get_settings().GOOGLE_CLIENT_ID,
+        client_secret=get_settings().GOOGLE_CLIENT_SECRET,
         server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
         client_kwargs={"scope": "openid email profile"},
     )
 except Exception as e:
     print(f"OAuth2 not configured: {e}")
     OAUTH_ENABLED = False
+
+
+@lru_cache(maxsize=len(SUPPORTED_PROVIDERS))
+def get_oauth_client(provider: str):
+    # one client per provider for the process lifetime, so the fetched
+    # openid configuration stays cached on it
+    return oauth.create_client(provider)
@@ -0,0 +1,12 @@
+from redis import Redis
+
+from app.core.config import settings
+
+# one module-level client so connections are pooled; short timeouts let a
+# Redis outage fall back to database lookups instead of stalling requests
+redis_client: Redis = Redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_timeout=0.5,
+    socket_connect_timeout=0.5,
+)
@@ -1,7 +1,25 @@
+import os
+
+from anyio import CapacityLimiter, to_thread
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
 # password hashing
-password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+password_context = CryptContext(
+    schemes=["bcrypt"],
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__ident="2b",
+    deprecated="auto",
+)
+
+# pin the native bcrypt extension so passlib never falls back to the much
+# slower os_crypt/builtin backends on the login and signup paths
+password_context.handler("bcrypt").set_backend("bcrypt")
+
+# bcrypt is CPU bound, so async callers run it in worker threads capped at
+# the number of cores instead of blocking the event loop
+bcrypt_limiter = CapacityLimiter(os.cpu_count() or 1)
 
 
 class Hasher:
@@ -12,3 +30,20 @@ class Hasher:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         return password_context.verify(plain_password, hashed_password)
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        return await to_thread.run_sync(
+            Hasher.hash_password, password, limiter=bcrypt_limiter
+        )
+
+    @staticmethod
+    async def verify_password_async(
+        plain_password: str, hashed_password: str
+    ) -> bool:
+        return await to_thread.run_sync(
+            Hasher.verify_password,
+            plain_password,
+            hashed_password,
+            limiter=bcrypt_limiter,
+        )
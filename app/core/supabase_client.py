@@ -1,8 +1,12 @@
+from functools import lru_cache
 from supabase import create_client, Client
 
-from app.core.config import settings
+from app.core.config import get_settings
 
-SUPABASE_URL = settings.SUPABASE_URL
-SUPABASE_KEY = settings.SUPABASE_SERVICE_ROLE_KEY
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+@lru_cache(maxsize=1)
+def get_supabase() -> Client:
+    # created on first storage call, so workers that never touch storage
+    # skip the client and http session setup
+    settings = get_settings()
+    return create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
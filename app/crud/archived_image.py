@@ -18,9 +18,18 @@ def select_archived_by_id(db: Session, id: UUID) -> Optional[ArchivedImageOut]:
     pass
 
 
-def select_archived_data(db: Session) -> Optional[List[ArchivedImages]]:
+def select_archived_data(
+    db: Session, limit: Optional[int] = None, offset: Optional[int] = 0
+) -> Optional[List[ArchivedImages]]:
+    query = select(ArchivedImages).order_by(
+        ArchivedImages.uploaded_at.desc(), ArchivedImages.id
+    )
+
+    if limit:
+        query = query.limit(limit).offset(offset)
+
     try:
-        data = db.query(ArchivedImages).all()
+        data = db.execute(query).scalars().all()
         return data
     except SQLAlchemyError as e:
         logger.error(f"{LOG_MSG} error reading archived data: {str(e)}")
@@ -1,10 +1,10 @@
 import logging
 
-from datetime import date
-from sqlalchemy import insert, select, and_
+from datetime import date, datetime, timedelta
+from sqlalchemy import insert, select, and_, tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from app.models.audit_trail import AuditTrail
@@ -29,9 +29,30 @@ class AuditTrailCrud:
             logger.error(f"{LOG_MSG} error inserting logs into audit trail: {str(e)}")
             raise
 
-    def get_all_audit(self, db: Session) -> List[AuditTrail]:
+    def get_all_audit(
+        self,
+        db: Session,
+        limit: Optional[int] = None,
+        offset: Optional[int] = 0,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[AuditTrail]:
+        """
+        Pass the (timestamp, id) of the last entry seen as cursor to seek to
+        the next page instead of skipping rows with OFFSET.
+        """
+        query = select(AuditTrail)
+
+        if cursor:
+            query = query.where(tuple_(AuditTrail.timestamp, AuditTrail.id) < cursor)
+            offset = 0
+
+        query = query.order_by(AuditTrail.timestamp.desc(), AuditTrail.id.desc())
+
+        if limit:
+            query = query.limit(limit).offset(offset)
+
         try:
-            audit = db.query(AuditTrail).all()
+            audit = db.execute(query).scalars().all()
             return audit
         except SQLAlchemyError as e:
             logger.error(f"{LOG_MSG} error getting all audit: {str(e)}")
@@ -52,8 +73,13 @@ class AuditTrailCrud:
     def get_audit_by_date(
         self, db: Session, start_date: date, end_date: date
     ) -> List[AuditTrail]:
+        # half-open range so the whole end date is included and the
+        # idx_audit_trail_on_timestamp btree can serve the scan
         query = select(AuditTrail).where(
-            and_(AuditTrail.timestamp > start_date, AuditTrail.timestamp < end_date)
+            and_(
+                AuditTrail.timestamp >= start_date,
+                AuditTrail.timestamp < end_date + timedelta(days=1),
+            )
         )
 
         try:
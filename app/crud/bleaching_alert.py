@@ -1,10 +1,13 @@
 import logging
+import math
 
+from cachetools import TTLCache
 from datetime import datetime, timezone
-from sqlalchemy import select, delete, update, and_, or_, func
+from sqlalchemy import select, delete, update, and_, or_, func, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from typing import List, Optional, Tuple
+from threading import Lock
+from typing import Any, List, Optional, Tuple
 from uuid import UUID
 
 from app.models.bleaching_alerts import BleachingAlert
@@ -16,6 +19,27 @@ from app.schemas.bleaching_alert import (
 
 logger = logging.getLogger(__name__)
 LOG_MSG = "CRUD:"
+EARTH_RADIUS_KM = 6371
+
+# the alert summary is public and only changes when an alert is written, so it
+# is kept briefly per process and dropped on every alert write below
+_alert_summary_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+_alert_summary_cache_lock = Lock()
+
+
+def get_cached_alert_summary() -> Optional[Any]:
+    with _alert_summary_cache_lock:
+        return _alert_summary_cache.get("summary")
+
+
+def cache_alert_summary(summary: Any) -> None:
+    with _alert_summary_cache_lock:
+        _alert_summary_cache["summary"] = summary
+
+
+def clear_alert_summary_cache() -> None:
+    with _alert_summary_cache_lock:
+        _alert_summary_cache.clear()
 
 
 def create_alert(
@@ -52,6 +76,7 @@ def create_alert(
     try:
         db.add(alert)
         db.commit()
+        clear_alert_summary_cache()
         db.refresh(alert)
 
         logger.info(
@@ -68,12 +93,9 @@ def create_alert(
 
 
 def get_alert_by_id(db: Session, alert_id: UUID) -> Optional[BleachingAlert]:
-    """Get a single alert by ID"""
-    query = select(BleachingAlert).where(BleachingAlert.id == alert_id)
-
+    """Get a single alert by ID, served from the identity map when already loaded"""
     try:
-        result = db.execute(query)
-        return result.scalar_one_or_none()
+        return db.get(BleachingAlert, alert_id)
     except SQLAlchemyError as e:
         logger.error(f"{LOG_MSG} error getting alert by id: {str(e)}")
         return None
@@ -84,8 +106,13 @@ def get_all_alerts(
     filters: Optional[AlertFilterParams] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = 0,
+    cursor: Optional[Tuple[datetime, UUID]] = None,
 ) -> List[BleachingAlert]:
-    """Get all alerts with optional filtering"""
+    """
+    Get all alerts with optional filtering, newest first.
+    Pass the (last_updated_at, id) of the last alert seen as cursor to seek
+    to the next page instead of skipping rows with OFFSET.
+    """
     query = select(BleachingAlert)
 
     if filters:
@@ -129,7 +156,15 @@ def get_all_alerts(
         if conditions:
             query = query.where(and_(*conditions))
 
-    query = query.order_by(BleachingAlert.last_updated_at.desc())
+    if cursor:
+        query = query.where(
+            tuple_(BleachingAlert.last_updated_at, BleachingAlert.id) < cursor
+        )
+        offset = 0
+
+    query = query.order_by(
+        BleachingAlert.last_updated_at.desc(), BleachingAlert.id.desc()
+    )
 
     if limit:
         query = query.limit(limit).offset(offset)
@@ -154,12 +189,30 @@ def get_active_alerts(db: Session) -> List[BleachingAlert]:
         return []
 
 
+def get_most_affected_alerts(db: Session, limit: int = 5) -> List[BleachingAlert]:
+    """Get the active alerts with the highest bleached coral counts"""
+    query = (
+        select(BleachingAlert)
+        .where(BleachingAlert.is_active == True)
+        .order_by(BleachingAlert.bleached_count.desc(), BleachingAlert.id)
+        .limit(limit)
+    )
+
+    try:
+        result = db.execute(query)
+        return result.scalars().all()
+    except SQLAlchemyError as e:
+        logger.error(f"{LOG_MSG} error getting most affected alerts: {str(e)}")
+        return []
+
+
 def get_alerts_by_location(
     db: Session, latitude: float, longitude: float, radius_km: float = 50.0
 ) -> List[BleachingAlert]:
     """
-    Get alerts within a radius of a location using simple bounding box
-    For accurate distance calculation, we do it in the service layer
+    Get alerts within a radius of a location.
+    The bounding box lets Postgres use the latitude/longitude indexes and the
+    Haversine distance is evaluated in SQL, so only matching rows are returned.
     """
     # Approximate degrees per kilometer
     # At the equator: 1 degree latitude ≈ 111 km
@@ -168,35 +221,34 @@ def get_alerts_by_location(
     # For longitude, we need to account for latitude
     # At the equator, 1 degree longitude ≈ 111 km
     # As we move away from equator, this decreases by cos(latitude)
-    import math
-
     lon_range = radius_km / (111.0 * abs(math.cos(math.radians(latitude))))
 
+    # Haversine formula, same as BleachingAlertService.calculate_distance
+    lat_rad = func.radians(BleachingAlert.latitude)
+    half_delta_lat = func.radians(BleachingAlert.latitude - latitude) / 2
+    half_delta_lon = func.radians(BleachingAlert.longitude - longitude) / 2
+    haversine = func.power(func.sin(half_delta_lat), 2) + math.cos(
+        math.radians(latitude)
+    ) * func.cos(lat_rad) * func.power(func.sin(half_delta_lon), 2)
+    # float rounding can push the term just past 1 for near-antipodal points,
+    # which makes asin raise in PostgreSQL
+    distance_km = (
+        2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(haversine)))
+    )
+
     query = select(BleachingAlert).where(
         and_(
             BleachingAlert.latitude.between(latitude - lat_range, latitude + lat_range),
             BleachingAlert.longitude.between(
                 longitude - lon_range, longitude + lon_range
             ),
+            distance_km <= radius_km,
         )
     )
 
     try:
         result = db.execute(query)
-        alerts = result.scalars().all()
-
-        # Now filter by actual distance using Haversine formula
-        from app.services.bleaching_alert_service import BleachingAlertService
-
-        filtered_alerts = []
-        for alert in alerts:
-            distance = BleachingAlertService.calculate_distance(
-                latitude, longitude, alert.latitude, alert.longitude
-            )
-            if distance <= radius_km:
-                filtered_alerts.append(alert)
-
-        return filtered_alerts
+        return result.scalars().all()
     except SQLAlchemyError as e:
         logger.error(f"{LOG_MSG} error getting alerts by location: {str(e)}")
         return []
@@ -225,6 +277,7 @@ def update_alert(
     try:
         result = db.execute(query)
         db.commit()
+        clear_alert_summary_cache()
 
         updated_alert = result.scalar_one_or_none()
         if updated_alert:
@@ -237,25 +290,27 @@ def update_alert(
 
 
 def resolve_alert(db: Session, alert_id: UUID) -> bool:
-    """Mark an alert as resolved"""
+    """Mark an active alert as resolved in a single UPDATE ... RETURNING"""
+    now = datetime.now(timezone.utc)
     query = (
         update(BleachingAlert)
-        .where(BleachingAlert.id == alert_id)
-        .values(
-            is_active=False,
-            resolved_at=datetime.now(timezone.utc),
-            last_updated_at=datetime.now(timezone.utc),
-        )
+        .where(BleachingAlert.id == alert_id, BleachingAlert.is_active.is_(True))
+        .values(is_active=False, resolved_at=now, last_updated_at=now)
+        .returning(BleachingAlert.id, BleachingAlert.location_name)
     )
 
     try:
-        result = db.execute(query)
+        resolved = db.execute(query).one_or_none()
         db.commit()
 
-        if result.rowcount > 0:
-            logger.info(f"{LOG_MSG} resolved alert {alert_id}")
-            return True
-        return False
+        if resolved is None:
+            return False
+
+        clear_alert_summary_cache()
+        logger.info(
+            f"{LOG_MSG} resolved alert {resolved.id} for {resolved.location_name}"
+        )
+        return True
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"{LOG_MSG} error resolving alert: {str(e)}")
@@ -269,6 +324,7 @@ def delete_alert(db: Session, alert_id: UUID) -> bool:
     try:
         result = db.execute(query)
         db.commit()
+        clear_alert_summary_cache()
 
         if result.rowcount > 0:
             logger.info(f"{LOG_MSG} deleted alert {alert_id}")
@@ -281,40 +337,47 @@ def delete_alert(db: Session, alert_id: UUID) -> bool:
 
 
 def get_alert_statistics(db: Session) -> dict:
-    """Get summary statistics for all alerts"""
-    try:
-        total_alerts = db.query(func.count(BleachingAlert.id)).scalar()
-        active_alerts = (
-            db.query(func.count(BleachingAlert.id))
-            .filter(BleachingAlert.is_active == True)
-            .scalar()
-        )
-
-        severity_counts = (
-            db.query(BleachingAlert.severity_level, func.count(BleachingAlert.id))
-            .group_by(BleachingAlert.severity_level)
-            .all()
-        )
-
-        severity_dict = {level: count for level, count in severity_counts}
-
-        avg_bleaching = (
-            db.query(func.avg(BleachingAlert.average_bleaching_percentage)).scalar()
-            or 0.0
-        )
+    """Get summary statistics for all alerts in a single aggregate query"""
+    query = select(
+        func.count(BleachingAlert.id).label("total_alerts"),
+        func.count(BleachingAlert.id)
+        .filter(BleachingAlert.is_active == True)
+        .label("active_alerts"),
+        func.count(BleachingAlert.id)
+        .filter(BleachingAlert.severity_level == "critical")
+        .label("critical_alerts"),
+        func.count(BleachingAlert.id)
+        .filter(BleachingAlert.severity_level == "high")
+        .label("high_alerts"),
+        func.count(BleachingAlert.id)
+        .filter(BleachingAlert.severity_level == "moderate")
+        .label("moderate_alerts"),
+        func.count(BleachingAlert.id)
+        .filter(BleachingAlert.severity_level == "low")
+        .label("low_alerts"),
+        func.coalesce(func.sum(BleachingAlert.bleached_count), 0).label(
+            "total_affected_corals"
+        ),
+        func.coalesce(func.avg(BleachingAlert.average_bleaching_percentage), 0.0).label(
+            "average_bleaching_percentage"
+        ),
+    )
 
-        total_affected = db.query(func.sum(BleachingAlert.bleached_count)).scalar() or 0
+    try:
+        stats = db.execute(query).one()
 
         return {
-            "total_alerts": total_alerts or 0,
-            "active_alerts": active_alerts or 0,
-            "resolved_alerts": (total_alerts or 0) - (active_alerts or 0),
-            "critical_alerts": severity_dict.get("critical", 0),
-            "high_alerts": severity_dict.get("high", 0),
-            "moderate_alerts": severity_dict.get("moderate", 0),
-            "low_alerts": severity_dict.get("low", 0),
-            "total_affected_corals": total_affected,
-            "average_bleaching_percentage": round(float(avg_bleaching), 2),
+            "total_alerts": stats.total_alerts,
+            "active_alerts": stats.active_alerts,
+            "resolved_alerts": stats.total_alerts - stats.active_alerts,
+            "critical_alerts": stats.critical_alerts,
+            "high_alerts": stats.high_alerts,
+            "moderate_alerts": stats.moderate_alerts,
+            "low_alerts": stats.low_alerts,
+            "total_affected_corals": stats.total_affected_corals,
+            "average_bleaching_percentage": round(
+                float(stats.average_bleaching_percentage), 2
+            ),
         }
     except SQLAlchemyError as e:
         logger.error(f"{LOG_MSG} error getting alert statistics: {str(e)}")
@@ -1,10 +1,12 @@
 import logging
 
+from cachetools import TTLCache
 from fastapi import HTTPException, status
-from sqlalchemy import select, delete, update, and_
+from sqlalchemy import select, delete, update, and_, func
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
-from typing import Dict, List, Optional
+from sqlalchemy.orm import Session, joinedload, selectinload
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from app.models.analysis_results import AnalysisResult
@@ -20,6 +22,26 @@ from app.schemas.coral_image import (
 logger = logging.getLogger(__name__)
 LOG_MSG = "CRUD:"
 
+# the trend dashboard is polled and its inputs move slowly, so the encoded
+# trend result is kept briefly per process and dropped on every image write
+_trend_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+_trend_cache_lock = Lock()
+
+
+def get_cached_trend_result() -> Optional[Any]:
+    with _trend_cache_lock:
+        return _trend_cache.get("trend")
+
+
+def cache_trend_result(trend: Any) -> None:
+    with _trend_cache_lock:
+        _trend_cache["trend"] = trend
+
+
+def clear_trend_cache() -> None:
+    with _trend_cache_lock:
+        _trend_cache.clear()
+
 
 def store_coral_image(db: Session, data: CoralImageCreate) -> Optional[CoralImages]:
     db_image = CoralImages(**data.model_dump())
@@ -27,6 +49,7 @@ def store_coral_image(db: Session, data: CoralImageCreate) -> Optional[CoralImag
     try:
         db.add(db_image)
         db.commit()
+        clear_trend_cache()
         db.refresh(db_image)
 
         return db_image
@@ -58,6 +81,7 @@ def save_analysis_results(
     try:
         db.add(image)
         db.commit()
+        clear_trend_cache()
         db.refresh(image)
 
         return image
@@ -87,9 +111,22 @@ def log_analytics_event(
         return None
 
 
-def get_all_images(db: Session) -> List[CoralImages]:
+def get_all_images(
+    db: Session, limit: Optional[int] = None, offset: Optional[int] = 0
+) -> List[CoralImages]:
     try:
-        query = select(CoralImages)
+        query = (
+            select(CoralImages)
+            .options(
+                selectinload(CoralImages.user),
+                selectinload(CoralImages.analysis_results),
+            )
+            .order_by(CoralImages.uploaded_at.desc(), CoralImages.id)
+        )
+
+        if limit:
+            query = query.limit(limit).offset(offset)
+
         result = db.execute(query).scalars().all()
 
         return result
@@ -100,13 +137,10 @@ def get_all_images(db: Session) -> List[CoralImages]:
 
 def get_all_images_with_results(db: Session) -> Optional[List[CoralImageOut]]:
     try:
-        images = (
-            db.query(CoralImages)
-            .options(
-                joinedload(CoralImages.user), joinedload(CoralImages.analysis_results)
-            )
-            .all()
+        query = select(CoralImages).options(
+            selectinload(CoralImages.user), selectinload(CoralImages.analysis_results)
         )
+        images = db.execute(query).scalars().all()
 
         filtered_images = [
             img
@@ -128,14 +162,15 @@ def get_all_images_with_results(db: Session) -> Optional[List[CoralImageOut]]:
 
 def get_public_images_with_results(db: Session) -> Optional[List[CoralImageOut]]:
     try:
-        images = (
-            db.query(CoralImages)
+        query = (
+            select(CoralImages)
             .where(CoralImages.is_public == True)
             .options(
-                joinedload(CoralImages.user), joinedload(CoralImages.analysis_results)
+                selectinload(CoralImages.user),
+                selectinload(CoralImages.analysis_results),
             )
-            .all()
         )
+        images = db.execute(query).scalars().all()
 
         filtered_images = [
             img
@@ -171,7 +206,14 @@ def get_coral_location(db: Session) -> List[CoralImageLocation] | None:
 
 def get_images_by_user(db: Session, id: UUID) -> Optional[List[CoralImages]]:
     try:
-        query = select(CoralImages).where(CoralImages.user_id == id)
+        query = (
+            select(CoralImages)
+            .where(CoralImages.user_id == id)
+            .options(
+                selectinload(CoralImages.user),
+                selectinload(CoralImages.analysis_results),
+            )
+        )
         result = db.execute(query).scalars().all()
 
         filtered_images = [
@@ -191,7 +233,14 @@ def get_images_by_user(db: Session, id: UUID) -> Optional[List[CoralImages]]:
 
 def get_all_images_by_user(db: Session, id: UUID) -> Optional[List[CoralImages]]:
     try:
-        query = select(CoralImages).where(CoralImages.user_id == id)
+        query = (
+            select(CoralImages)
+            .where(CoralImages.user_id == id)
+            .options(
+                selectinload(CoralImages.user),
+                selectinload(CoralImages.analysis_results),
+            )
+        )
         result = db.execute(query).scalars().all()
 
         return result
@@ -200,9 +249,36 @@ def get_all_images_by_user(db: Session, id: UUID) -> Optional[List[CoralImages]]
         return None
 
 
+def count_user_images_by_publicity(
+    db: Session, id: UUID
+) -> Optional[Tuple[int, int]]:
+    """Return (public, total) image counts for a user in one aggregate"""
+    query = select(
+        func.count(CoralImages.id).filter(CoralImages.is_public == True),
+        func.count(CoralImages.id),
+    ).where(CoralImages.user_id == id)
+
+    try:
+        public_count, total_count = db.execute(query).one()
+
+        return public_count, total_count
+    except SQLAlchemyError as e:
+        logger.error(f"{LOG_MSG} error counting user images by publicity: {str(e)}")
+        return None
+
+
 def get_image_by_id(db: Session, id: UUID) -> CoralImages:
     try:
-        query = select(CoralImages).where(CoralImages.id == id)
+        # both callers render the uploader and analysis results; load them
+        # eagerly instead of lazy-loading each relationship afterwards
+        query = (
+            select(CoralImages)
+            .options(
+                joinedload(CoralImages.user),
+                selectinload(CoralImages.analysis_results),
+            )
+            .where(CoralImages.id == id)
+        )
         result = db.execute(query).scalars().first()
 
         return result
@@ -225,6 +301,7 @@ def update_image_details(
     try:
         result = db.execute(query)
         db.commit()
+        clear_trend_cache()
 
         return result.scalar_one_or_none()
     except SQLAlchemyError as e:
@@ -239,6 +316,7 @@ def change_coral_image_public_status(db: Session, id: UUID, status: bool) -> boo
     try:
         result = db.execute(query)
         db.commit()
+        clear_trend_cache()
 
         return result.rowcount > 0
     except SQLAlchemyError as e:
@@ -257,6 +335,7 @@ def change_all_user_coral_image_status(db: Session, user_id: UUID, status: bool)
     try:
         result = db.execute(query)
         db.commit()
+        clear_trend_cache()
 
         return result.rowcount
     except SQLAlchemyError as e:
@@ -273,6 +352,7 @@ def delete_image(db: Session, id: UUID):
     try:
         result = db.execute(query)
         db.commit()
+        clear_trend_cache()
 
         return result.rowcount > 0
     except SQLAlchemyError as e:
@@ -281,15 +361,20 @@ def delete_image(db: Session, id: UUID):
         raise
 
 
-def delete_selected_images(db: Session, ids: List[UUID]) -> int:
-    query = delete(CoralImages).where(CoralImages.id.in_(ids))
+def delete_selected_images(db: Session, ids: List[UUID]) -> List[str]:
+    query = (
+        delete(CoralImages)
+        .where(CoralImages.id.in_(ids))
+        .returning(CoralImages.filename)
+    )
 
     try:
-        result = db.execute(query)
+        filenames = db.execute(query).scalars().all()
         db.commit()
+        clear_trend_cache()
 
-        return result.rowcount
+        return filenames
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"{LOG_MSG} error deleting images")
-        return 0
+        return []
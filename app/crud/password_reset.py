@@ -96,18 +96,17 @@ def mark_reset_token_as_used(db: Session, token: str) -> bool:
         Exception: If an error occurs during the database transaction.
     """
 
-    query = select(PasswordResetToken).where(PasswordResetToken.token == token)
+    query = (
+        update(PasswordResetToken)
+        .where(PasswordResetToken.token == token)
+        .values(used_at=datetime.now(timezone.utc))
+    )
 
     try:
         result = db.execute(query)
-        reset_token = result.scalar_one_or_none()
-
-        if reset_token:
-            reset_token.used_at = datetime.now(timezone.utc)
-            db.commit()
-            return True
-        else:
-            return False
+        db.commit()
+
+        return result.rowcount > 0
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"Error updating reset_token: {e}")
@@ -144,15 +143,16 @@ def cleanup_user_token(db: Session, id: UUID) -> bool:
         return False
 
 
-def cleanup_expired_token(db: Session) -> bool:
+def cleanup_expired_token(db: Session) -> int:
     """
-    Deletes all expired password reset tokens from the database, regardless of user.
+    Deletes all expired password reset tokens from the database, regardless of user,
+    in a single bulk DELETE.
 
     Args:
         db (Session): SQLAlchemy database session.
 
     Returns:
-        bool: True if expired tokens were deleted successfully, False otherwise.
+        int: The number of expired tokens deleted, 0 if the delete failed.
     """
 
     query = delete(PasswordResetToken).where(
@@ -160,11 +160,11 @@ def cleanup_expired_token(db: Session) -> bool:
     )
 
     try:
-        db.execute(query)
+        result = db.execute(query)
         db.commit()
 
-        return True
+        return result.rowcount
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"Error deleting token: {e}")
-        return False
+        return 0
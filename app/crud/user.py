@@ -1,32 +1,109 @@
+import hashlib
 import logging
+import time
 
 from datetime import datetime, timedelta, timezone
-from sqlalchemy import select, delete, update, and_, or_
+from redis.exceptions import RedisError
+from sqlalchemy import select, delete, update, and_, exists
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from uuid import UUID
 
+from app.core.redis_client import redis_client
 from app.models.users import User, UserRole
-from app.schemas.user import CreateUser, UpdateUser
+from app.schemas.user import CreateUser, UpdateUser, UserOut
 
 logger = logging.getLogger(__name__)
 LOG_MSG = "Crud:"
 
+# get_current_user reads the serialized UserOut from Redis so every worker
+# shares one entry per user, and per access token so a hit also skips the JWT
+# decode; every session key is tracked in a per-user set and writes below
+# delete the user entry together with all of its sessions
+USER_CACHE_TTL_SECONDS = 60
+
+
+def _user_cache_key(email: str) -> str:
+    return f"user:email:{email}"
+
+
+def _user_sessions_key(email: str) -> str:
+    return f"user:sessions:{email}"
+
+
+def _session_cache_key(token: str) -> str:
+    return "sess:" + hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def clear_user_cache(*emails: Optional[str]) -> None:
+    emails = [email for email in emails if email]
+    if not emails:
+        return
+
+    sessions_keys = [_user_sessions_key(email) for email in emails]
+
+    try:
+        session_keys = [
+            key
+            for members in map(redis_client.smembers, sessions_keys)
+            for key in members
+        ]
+        redis_client.delete(
+            *map(_user_cache_key, emails), *sessions_keys, *session_keys
+        )
+    except RedisError as e:
+        logger.warning(f"{LOG_MSG} error evicting cached users from redis: {str(e)}")
+
+
+def get_cached_session_user(token: str) -> Optional[UserOut]:
+    try:
+        cached = redis_client.get(_session_cache_key(token))
+    except RedisError as e:
+        logger.warning(f"{LOG_MSG} error reading cached session from redis: {str(e)}")
+        return None
+
+    return UserOut.model_validate_json(cached) if cached is not None else None
+
+
+def cache_session_user(token: str, user: UserOut, expires_at: int) -> None:
+    """Cache user for token until the token expires, at most USER_CACHE_TTL_SECONDS"""
+    ttl = min(USER_CACHE_TTL_SECONDS, int(expires_at - time.time()))
+    if ttl <= 0:
+        return
+
+    key = _session_cache_key(token)
+    sessions_key = _user_sessions_key(user.email)
+
+    try:
+        pipeline = redis_client.pipeline()
+        pipeline.setex(key, ttl, user.model_dump_json())
+        pipeline.sadd(sessions_key, key)
+        pipeline.expire(sessions_key, USER_CACHE_TTL_SECONDS)
+        pipeline.execute()
+    except RedisError as e:
+        logger.warning(f"{LOG_MSG} error caching session in redis: {str(e)}")
+
 
 def create_user(
     db: Session, payload: CreateUser, hashed_password: str
 ) -> Optional[User]:
-    user = User(
-        **payload.model_dump(exclude={"password", "provider"}),
-        password=hashed_password,
-        provider="local",
+    """Insert a local user, returning None if the email is already taken"""
+    query = (
+        insert(User)
+        .values(
+            **payload.model_dump(exclude={"password", "provider"}),
+            password=hashed_password,
+            provider="local",
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
     )
 
     try:
-        db.add(user)
+        user = db.execute(query).scalar_one_or_none()
         db.commit()
-        db.refresh(user)
 
         return user
     except Exception as e:
@@ -85,6 +162,31 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
         return None
 
 
+def get_user_out_by_email_cached(db: Session, email: str) -> Optional[UserOut]:
+    key = _user_cache_key(email)
+
+    try:
+        cached = redis_client.get(key)
+    except RedisError as e:
+        logger.warning(f"{LOG_MSG} error reading cached user from redis: {str(e)}")
+        cached = None
+
+    if cached is not None:
+        return UserOut.model_validate_json(cached)
+
+    user = get_user_by_email(db, email)
+    if user is None:
+        return None
+
+    user_out = UserOut.model_validate(user)
+    try:
+        redis_client.setex(key, USER_CACHE_TTL_SECONDS, user_out.model_dump_json())
+    except RedisError as e:
+        logger.warning(f"{LOG_MSG} error caching user in redis: {str(e)}")
+
+    return user_out
+
+
 def get_user_by_id(db: Session, id: UUID) -> Optional[User]:
     query = select(User).where(User.id == id)
 
@@ -98,9 +200,57 @@ def get_user_by_id(db: Session, id: UUID) -> Optional[User]:
         return None
 
 
-def get_all_users(db: Session) -> Optional[List[User]]:
+def get_password_hash(
+    db: Session, id: UUID, actor_id: Optional[UUID] = None
+) -> Optional[str]:
+    """Read only the stored password hash; UserOut never carries it"""
+    query = select(User.password).where(User.id == id)
+    if actor_id is not None:
+        query = query.where(User.id == actor_id)
+
+    try:
+        return db.execute(query).scalar_one_or_none()
+    except SQLAlchemyError as e:
+        logger.error(f"{LOG_MSG} database error occurred: {str(e)}")
+        raise
+
+
+def get_user_profile(db: Session, id: UUID) -> Optional[str]:
+    """Read only the stored profile picture filename"""
+    query = select(User.profile).where(User.id == id)
+
+    try:
+        return db.execute(query).scalar_one_or_none()
+    except SQLAlchemyError as e:
+        logger.error(f"{LOG_MSG} database error occurred: {str(e)}")
+        raise
+
+
+def user_exists(db: Session, id: UUID) -> bool:
+    """Check for a user with an EXISTS probe instead of loading the row"""
+    query = select(exists().where(User.id == id))
+
+    try:
+        return db.execute(query).scalar()
+    except SQLAlchemyError as e:
+        logger.error(f"{LOG_MSG} database error occurred: {str(e)}")
+        raise
+
+
+def get_all_users(
+    db: Session, limit: Optional[int] = None, after_id: Optional[UUID] = None
+) -> Optional[List[User]]:
+    """Users ordered by id; pass the last id seen as after_id for the next page"""
+    query = select(User).order_by(User.id)
+
+    if after_id:
+        query = query.where(User.id > after_id)
+
+    if limit:
+        query = query.limit(limit)
+
     try:
-        users = db.query(User).all()
+        users = db.execute(query).scalars().all()
         return users
     except SQLAlchemyError as e:
         logger.error(f"{LOG_MSG} database error occurred: {str(e)}")
@@ -108,9 +258,7 @@ def get_all_users(db: Session) -> Optional[List[User]]:
 
 
 def get_all_admin(db: Session) -> Optional[List[User]]:
-    query = select(User).where(
-        or_(User.role == UserRole.ADMIN, User.role == UserRole.SUPER_ADMIN)
-    )
+    query = select(User).where(User.role.in_([UserRole.ADMIN, UserRole.SUPER_ADMIN]))
 
     try:
         result = db.execute(query)
@@ -122,15 +270,31 @@ def get_all_admin(db: Session) -> Optional[List[User]]:
         return None
 
 
-def update_user_details(db: Session, id: UUID, payload: UpdateUser) -> Optional[User]:
+def update_user_details(
+    db: Session, id: UUID, payload: UpdateUser, actor_id: Optional[UUID] = None
+) -> Optional[User]:
     new_data = payload.model_dump(exclude_unset=True)
     query = update(User).where(User.id == id).values(**new_data).returning(User)
+    # ownership is part of the WHERE clause, so no row means not allowed
+    if actor_id is not None:
+        query = query.where(User.id == actor_id)
 
     try:
+        # RETURNING only gives the new email, so an email change reads (and
+        # locks) the old one first to clear its cache and sessions as well
+        old_email = None
+        if "email" in new_data:
+            old_email = db.execute(
+                select(User.email).where(User.id == id).with_for_update()
+            ).scalar_one_or_none()
+
         result = db.execute(query)
+        updated_user = result.scalar_one_or_none()
+        email = updated_user.email if updated_user else None
         db.commit()
+        clear_user_cache(email, old_email if updated_user else None)
 
-        return result.scalar_one_or_none()
+        return updated_user
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"{LOG_MSG} error updating user data: {str(e)}")
@@ -138,43 +302,55 @@ def update_user_details(db: Session, id: UUID, payload: UpdateUser) -> Optional[
 
 
 def update_user_profile(db: Session, id: UUID, profile: str) -> Optional[User]:
-    query = update(User).where(User.id == id).values(profile=profile)
+    query = update(User).where(User.id == id).values(profile=profile).returning(User)
 
     try:
-        db.execute(query)
+        result = db.execute(query)
+        updated_user = result.scalar_one_or_none()
+        email = updated_user.email if updated_user else None
         db.commit()
+        clear_user_cache(email)
 
-        return db.query(User).filter(User.id == id).one_or_none()
+        return updated_user
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"{LOG_MSG} error updating profile picture: {str(e)}")
         raise
 
 
-def delete_user(db: Session, id: UUID) -> bool:
-    query = delete(User).where(User.id == id)
+def delete_user(db: Session, id: UUID, actor_id: Optional[UUID] = None) -> bool:
+    query = delete(User).where(User.id == id).returning(User.email)
+    if actor_id is not None:
+        query = query.where(User.id == actor_id)
 
     try:
-        result = db.execute(query)
+        email = db.execute(query).scalar_one_or_none()
         db.commit()
+        clear_user_cache(email)
 
-        return result.rowcount > 0
+        return email is not None
     except SQLAlchemyError as e:
         db.rollback()
         logger.error(f"{LOG_MSG} error deleting user: {str(e)}")
         raise
 
 
-def change_password(db: Session, id: UUID, new_password: str) -> Optional[User]:
+def change_password(
+    db: Session, id: UUID, new_password: str, actor_id: Optional[UUID] = None
+) -> Optional[User]:
     query = (
         update(User).where(User.id == id).values(password=new_password).returning(User)
     )
+    if actor_id is not None:
+        query = query.where(User.id == actor_id)
 
     try:
         result = db.execute(query)
+        updated_user = result.scalar_one_or_none()
+        email = updated_user.email if updated_user else None
         db.commit()
+        clear_user_cache(email)
 
-        updated_user = result.scalar_one_or_none()
         return updated_user
     except SQLAlchemyError as e:
         db.rollback()
@@ -189,11 +365,13 @@ def deactivate_inactive_accounts(db: Session) -> Optional[bool]:
         update(User)
         .where(and_(User.last_login < cutoff_date, User.is_active == True))
         .values(is_active=False)
+        .returning(User.email)
     )
 
     try:
-        db.execute(query)
+        emails = db.execute(query).scalars().all()
         db.commit()
+        clear_user_cache(*emails)
 
         return True
     except SQLAlchemyError as e:
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
 
+from app.crud.user import clear_user_cache
 from app.models.verification_tokens import VerificationToken
 from app.models.users import User
 
@@ -96,14 +97,20 @@ def verify_token_and_mark_used(
 
 
 def verify_user(db: Session, id: UUID) -> bool:
-    query = update(User).where(User.id == id).values(is_verified=True, is_active=True)
+    query = (
+        update(User)
+        .where(User.id == id)
+        .values(is_verified=True, is_active=True)
+        .returning(User.email)
+    )
 
     try:
-        result = db.execute(query)
-        if result.rowcount == 0:
+        email = db.execute(query).scalar_one_or_none()
+        if email is None:
             return False
 
         db.commit()
+        clear_user_cache(email)
 
         return True
     except SQLAlchemyError as e:
@@ -30,9 +30,20 @@ def select_content(db: Session, id: UUID) -> Optional[WebsiteContentOut]:
         return None
 
 
-def select_all_content(db: Session) -> Optional[List[WebsiteContentOut]]:
+def select_all_content(
+    db: Session, limit: Optional[int] = None, after_id: Optional[UUID] = None
+) -> Optional[List[WebsiteContentOut]]:
+    """Contents ordered by id; pass the last id seen as after_id for the next page"""
+    query = select(WebsiteContent).order_by(WebsiteContent.id)
+
+    if after_id:
+        query = query.where(WebsiteContent.id > after_id)
+
+    if limit:
+        query = query.limit(limit)
+
     try:
-        content = db.query(WebsiteContent).all()
+        content = db.execute(query).scalars().all()
         return content
     except SQLAlchemyError as e:
         logger.error(f"{LOG_MSG} error getting all content: {str(e)}")
@@ -58,13 +69,16 @@ def select_content_by_section(
         return None
 
 
-def store_content(db: Session, payload: WebsiteContentCreate):
+def store_content(db: Session, payload: WebsiteContentCreate, commit: bool = True):
     content = WebsiteContent(**payload.model_dump())
 
     try:
         db.add(content)
-        db.commit()
-        db.refresh(content)
+        if commit:
+            db.commit()
+            db.refresh(content)
+        else:
+            db.flush()
 
         return content
     except SQLAlchemyError as e:
@@ -73,7 +87,9 @@ def store_content(db: Session, payload: WebsiteContentCreate):
         raise
 
 
-def update_content(db: Session, id: UUID, payload: WebsiteContentUpdate):
+def update_content(
+    db: Session, id: UUID, payload: WebsiteContentUpdate, commit: bool = True
+):
     new_data = payload.model_dump(exclude_unset=True)
     query = (
         update(WebsiteContent)
@@ -84,7 +100,8 @@ def update_content(db: Session, id: UUID, payload: WebsiteContentUpdate):
 
     try:
         result = db.execute(query)
-        db.commit()
+        if commit:
+            db.commit()
 
         return result.scalar_one_or_none()
     except SQLAlchemyError as e:
@@ -93,12 +110,13 @@ def update_content(db: Session, id: UUID, payload: WebsiteContentUpdate):
         raise
 
 
-def delete_content(db: Session, id: UUID):
+def delete_content(db: Session, id: UUID, commit: bool = True):
     query = delete(WebsiteContent).where(WebsiteContent.id == id)
 
     try:
         result = db.execute(query)
-        db.commit()
+        if commit:
+            db.commit()
 
         return result.rowcount > 0
     except SQLAlchemyError as e:
@@ -0,0 +1,20 @@
+import logging
+
+from celery import shared_task
+
+from app.crud.password_reset import cleanup_expired_token
+from app.db.connection import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def cleanup_expired_reset_tokens():
+    db = SessionLocal()
+    try:
+        deleted_count = cleanup_expired_token(db)
+        logger.info(f"cleaned up {deleted_count} expired reset tokens")
+    except Exception as e:
+        logger.error(f"error running job to clean up expired reset tokens: {str(e)}")
+    finally:
+        db.close()
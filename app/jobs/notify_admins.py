@@ -0,0 +1,54 @@
+import asyncio
+import logging
+
+from celery import shared_task
+
+# importing the configured app makes it current, so .delay() from the web
+# process publishes to the redis broker
+from app.core.celery_app import celery_app  # noqa: F401
+from app.crud.user import get_all_admin
+from app.db.connection import SessionLocal
+from app.services.email_service import send_web_update_email_to_admins
+
+logger = logging.getLogger(__name__)
+
+
+async def _send_to_admins(admins, title: str, content: str):
+    return await asyncio.gather(
+        *(
+            send_web_update_email_to_admins(
+                emails=admin.email,
+                name=f"{admin.first_name} {admin.last_name}",
+                title=title,
+                content=content,
+            )
+            for admin in admins
+        ),
+        return_exceptions=True,
+    )
+
+
+@shared_task
+def notify_admins_of_update(content_id: str, title: str, content: str):
+    db = SessionLocal()
+    try:
+        admins = get_all_admin(db)
+        if not admins:
+            logger.warning(f"no admin found to notify of content {content_id} update")
+            return
+
+        results = asyncio.run(_send_to_admins(admins, title, content))
+
+        failed_emails = [
+            admin.email
+            for admin, success in zip(admins, results)
+            if success is not True
+        ]
+        if failed_emails:
+            logger.error(
+                f"error sending content {content_id} update email to {', '.join(failed_emails)}"
+            )
+    except Exception as e:
+        logger.error(f"error running job to notify admins of content update: {str(e)}")
+    finally:
+        db.close()
@@ -1,20 +1,34 @@
 import logging
 import time
 
+from anyio import to_thread
+from contextlib import asynccontextmanager
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.api.v1.router import api_router
 from app.core.auth import get_current_user
 from app.core.config import settings
+from app.db.connection import get_db, warm_pool
 from app.schemas.user import UserOut
 from app.services.ai_inference import load_model
+from app.utils.responses import NEXT_CURSOR_HEADER
 
 logger = logging.getLogger(__name__)
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    await to_thread.run_sync(warm_pool)
+    yield
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(SessionMiddleware, secret_key=settings.SESSION_SECRET)
 app.add_middleware(
@@ -27,6 +41,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(api_router, prefix="/api/v1")
@@ -46,6 +61,20 @@ async def root():
     return {"message": "Welcome to the API"}
 
 
+@app.get("/health")
+def health(db: Session = Depends(get_db)):
+    try:
+        db.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.error(f"health check failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="database unavailable",
+        )
+
+    return {"status": "ok"}
+
+
 @app.get("/api/v1/me")
 async def get_me(request: Request, current_user: UserOut = Depends(get_current_user)):
     try:
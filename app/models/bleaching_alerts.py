@@ -9,6 +9,7 @@ from sqlalchemy import (
     Boolean,
     Text,
     func,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -22,8 +23,8 @@ class BleachingAlert(Base):
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # Location information
-    latitude = Column(Float, nullable=False, index=True)
-    longitude = Column(Float, nullable=False, index=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
     location_name = Column(String(255), nullable=True)
 
     # Alert severity and statistics
@@ -53,5 +54,32 @@ class BleachingAlert(Base):
     # Geographic clustering info
     cluster_radius_km = Column(Float, nullable=True)  # radius in kilometers
 
+    __table_args__ = (
+        Index(
+            "idx_bleaching_alerts_on_location",
+            "latitude",
+            "longitude",
+            postgresql_include=["severity_level", "is_active"],
+        ),
+        Index(
+            "idx_bleaching_alerts_on_last_updated_at_id",
+            last_updated_at.desc(),
+            id.desc(),
+        ),
+        Index(
+            "idx_bleaching_alerts_on_bleached_count_id_active",
+            bleached_count.desc(),
+            id,
+            postgresql_where=is_active.is_(True),
+        ),
+        # rows are appended in detection order, so a BRIN range index serves
+        # the start/end date filters at a fraction of a btree's size
+        Index(
+            "idx_bleaching_alerts_on_first_detected_at",
+            first_detected_at,
+            postgresql_using="brin",
+        ),
+    )
+
     def __repr__(self):
         return f"<BleachingAlert {self.id} - {self.severity_level} at ({self.latitude}, {self.longitude})>"
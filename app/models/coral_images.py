@@ -6,6 +6,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     String,
     func,
 )
@@ -46,3 +47,7 @@ class CoralImages(Base):
     )
 
     user = relationship("User", back_populates="coral_images")
+
+    __table_args__ = (
+        Index("idx_coral_images_on_user_id_is_public", "user_id", "is_public"),
+    )
@@ -100,6 +100,19 @@ class User(Base):
         "AuditTrail", back_populates="user", cascade="all, delete-orphan"
     )
 
+    def to_token_claims(self) -> dict:
+        """
+        Build the user_data claims embedded in access tokens.
+        """
+        return {
+            "id": str(self.id),
+            "is_verified": self.is_verified,
+            "role": self.role,
+            "email": self.email,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+        }
+
     __table_args__ = (
         Index("idx_users_on_id", "id"),
         Index("idx_users_on_email", "email"),
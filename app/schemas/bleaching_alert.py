@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from typing import List, Optional
 from uuid import UUID
 
@@ -87,6 +87,11 @@ class BleachingAlertOut(BaseBleachingAlert):
         from_attributes = True
 
 
+# validates whole result lists in one pydantic-core call instead of one
+# model_validate per row
+BleachingAlertListAdapter = TypeAdapter(List[BleachingAlertOut])
+
+
 class BleachingAlertSummary(BaseModel):
     """Summary statistics for all alerts"""
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
@@ -61,6 +61,9 @@ class CoralImageOut(BaseCoralImage):
         from_attributes = True
 
 
+CoralImageListAdapter = TypeAdapter(List[CoralImageOut])
+
+
 class CoralImageLocation(BaseModel):
     latitude: Optional[float] = None
     longitude: Optional[float] = None
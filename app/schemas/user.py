@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from pydantic import BaseModel, EmailStr, StringConstraints
+from pydantic import BaseModel, EmailStr, StringConstraints, TypeAdapter
 from typing import Annotated, List, Optional
 from uuid import UUID
 
@@ -87,3 +87,6 @@ class UserOut(UserBase):
 
     class Config:
         from_attributes = True
+
+
+UserListAdapter = TypeAdapter(List[UserOut])
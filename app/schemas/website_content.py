@@ -1,6 +1,6 @@
 from datetime import datetime
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Optional
 from uuid import UUID
 
 
@@ -25,3 +25,7 @@ class WebsiteContentOut(WebsiteContentBase):
 
     class Config:
         from_attributes = True
+
+
+WebsiteContentAdapter = TypeAdapter(WebsiteContentOut)
+WebsiteContentListAdapter = TypeAdapter(List[WebsiteContentOut])
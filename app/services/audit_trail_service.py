@@ -1,9 +1,9 @@
 import logging
 
-from datetime import date
+from datetime import date, datetime
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from app.crud.audit_trail import audit_trail_crud
@@ -21,8 +21,16 @@ class AuditTrailService:
 
         return res
 
-    def select_all_audit(self, db: Session) -> List[AuditTrailOut]:
-        return audit_trail_crud.get_all_audit(db)
+    def select_all_audit(
+        self,
+        db: Session,
+        limit: Optional[int] = None,
+        offset: Optional[int] = 0,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[AuditTrailOut]:
+        return audit_trail_crud.get_all_audit(
+            db, limit=limit, offset=offset, cursor=cursor
+        )
 
     def select_audit_by_id(self, db: Session, id: UUID):
         res = audit_trail_crud.get_audit_by_id(db, id)
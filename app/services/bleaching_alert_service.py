@@ -1,20 +1,24 @@
 import logging
 import math
+import numpy as np
 
 from collections import defaultdict
 from datetime import datetime, timezone
 from fastapi import HTTPException, status
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, select
 from sqlalchemy.orm import Session
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from app.crud.bleaching_alert import (
+    EARTH_RADIUS_KM,
+    cache_alert_summary,
+    get_cached_alert_summary,
     create_alert,
     get_alert_by_id,
-    get_all_alerts,
     get_active_alerts,
     get_alerts_by_location,
+    get_most_affected_alerts,
     update_alert,
     resolve_alert,
     delete_alert,
@@ -26,8 +30,8 @@ from app.schemas.bleaching_alert import (
     CreateBleachingAlert,
     UpdateBleachingAlert,
     BleachingAlertOut,
+    BleachingAlertListAdapter,
     BleachingAlertSummary,
-    AlertFilterParams,
 )
 from app.utils.geocoding import geocoding_service
 
@@ -95,56 +99,41 @@ class BleachingAlertService:
                 f"{LOG_MSG} Starting location clustering with radius={radius_km}km, min_bleaching={min_bleaching_percentage}%"
             )
 
-            # First, let's see ALL coral images with analysis
-            total_query = db.query(func.count(CoralImages.id)).join(
-                AnalysisResult, CoralImages.id == AnalysisResult.image_id
+            # Diagnostic counts over the image/analysis join in one pass
+            has_location = and_(
+                CoralImages.latitude.isnot(None),
+                CoralImages.longitude.isnot(None),
             )
-            total_count = total_query.scalar()
-            logger.info(f"{LOG_MSG} Total coral images with analysis: {total_count}")
-
-            # Check how many have locations
-            with_location_query = (
-                db.query(func.count(CoralImages.id))
-                .join(AnalysisResult, CoralImages.id == AnalysisResult.image_id)
-                .filter(
-                    and_(
-                        CoralImages.latitude.isnot(None),
-                        CoralImages.longitude.isnot(None),
-                    )
-                )
-            )
-            with_location_count = with_location_query.scalar()
-            logger.info(f"{LOG_MSG} Coral images with location: {with_location_count}")
-
-            # Check how many have bleaching percentage
-            with_bleaching_query = (
-                db.query(func.count(CoralImages.id))
-                .join(AnalysisResult, CoralImages.id == AnalysisResult.image_id)
-                .filter(
-                    and_(
-                        CoralImages.latitude.isnot(None),
-                        CoralImages.longitude.isnot(None),
-                        AnalysisResult.bleaching_percentage.isnot(None),
-                    )
-                )
+            counts_query = select(
+                func.count(CoralImages.id).label("total"),
+                func.count(CoralImages.id).filter(has_location).label("with_location"),
+                func.count(CoralImages.id)
+                .filter(has_location, AnalysisResult.bleaching_percentage.isnot(None))
+                .label("with_bleaching"),
+            ).join(AnalysisResult, CoralImages.id == AnalysisResult.image_id)
+            counts = db.execute(counts_query).one()
+            logger.info(f"{LOG_MSG} Total coral images with analysis: {counts.total}")
+            logger.info(
+                f"{LOG_MSG} Coral images with location: {counts.with_location}"
             )
-            with_bleaching_count = with_bleaching_query.scalar()
             logger.info(
-                f"{LOG_MSG} Coral images with location and bleaching percentage: {with_bleaching_count}"
+                f"{LOG_MSG} Coral images with location and bleaching percentage: {counts.with_bleaching}"
             )
 
             # Get all possible classification labels in the database
-            classification_query = db.query(
+            classification_query = select(
                 AnalysisResult.classification_labels
             ).distinct()
-            all_classifications = [c[0] for c in classification_query.all() if c[0]]
+            all_classifications = [
+                label for label in db.execute(classification_query).scalars() if label
+            ]
             logger.info(
                 f"{LOG_MSG} All classification labels in database: {all_classifications}"
             )
 
             # Now get the actual data - Let's be MORE PERMISSIVE for testing
             query = (
-                db.query(
+                select(
                     CoralImages.id,
                     CoralImages.latitude,
                     CoralImages.longitude,
@@ -152,7 +141,7 @@ class BleachingAlertService:
                     AnalysisResult.classification_labels,
                 )
                 .join(AnalysisResult, CoralImages.id == AnalysisResult.image_id)
-                .filter(
+                .where(
                     and_(
                         CoralImages.latitude.isnot(None),
                         CoralImages.longitude.isnot(None),
@@ -161,7 +150,7 @@ class BleachingAlertService:
                 )
             )
 
-            all_with_bleaching = query.all()
+            all_with_bleaching = db.execute(query).all()
             logger.info(
                 f"{LOG_MSG} Found {len(all_with_bleaching)} corals with location and bleaching percentage"
             )
@@ -229,14 +218,24 @@ class BleachingAlertService:
             corals = coral_data
 
             clusters = []
-            used_indices = set()
+
+            # radians computed once so each seed's distances to the remaining
+            # corals come from one vectorized haversine instead of a Python loop
+            lat_rad = np.radians(
+                np.fromiter((c["latitude"] for c in corals), dtype=np.float64)
+            )
+            lon_rad = np.radians(
+                np.fromiter((c["longitude"] for c in corals), dtype=np.float64)
+            )
+            cos_lat = np.cos(lat_rad)
+            unassigned = np.ones(len(corals), dtype=bool)
 
             logger.info(
                 f"{LOG_MSG} Starting clustering process with {len(corals)} corals"
             )
 
             for i, coral in enumerate(corals):
-                if i in used_indices:
+                if not unassigned[i]:
                     continue
 
                 # Start a new cluster
@@ -246,24 +245,27 @@ class BleachingAlertService:
                     "corals": [coral],
                     "coral_ids": [coral["id"]],
                 }
-                used_indices.add(i)
+                unassigned[i] = False
 
                 # Find all corals within radius
-                for j, other_coral in enumerate(corals):
-                    if j in used_indices:
-                        continue
-
-                    distance = BleachingAlertService.calculate_distance(
-                        coral["latitude"],
-                        coral["longitude"],
-                        other_coral["latitude"],
-                        other_coral["longitude"],
+                candidates = np.flatnonzero(unassigned)
+                if candidates.size:
+                    a = (
+                        np.sin((lat_rad[candidates] - lat_rad[i]) / 2) ** 2
+                        + cos_lat[i]
+                        * cos_lat[candidates]
+                        * np.sin((lon_rad[candidates] - lon_rad[i]) / 2) ** 2
+                    )
+                    a = np.clip(a, 0.0, 1.0)
+                    distances = (
+                        2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
                     )
 
-                    if distance <= radius_km:
+                    for j in candidates[distances <= radius_km]:
+                        other_coral = corals[j]
                         cluster["corals"].append(other_coral)
                         cluster["coral_ids"].append(other_coral["id"])
-                        used_indices.add(j)
+                        unassigned[j] = False
 
                 # Calculate cluster statistics
                 if len(cluster["corals"]) > 0:
@@ -485,16 +487,18 @@ class BleachingAlertService:
         return "\n• ".join([""] + base_recommendations)
 
     def get_alert_summary(self, db: Session) -> BleachingAlertSummary:
-        """Get comprehensive alert summary"""
+        """Get comprehensive alert summary, served from a short-lived cache"""
+        cached = get_cached_alert_summary()
+        if cached is not None:
+            return cached
+
         try:
             stats = get_alert_statistics(db)
 
             # Get most affected locations (top 5 by bleached count)
-            most_affected = get_all_alerts(
-                db, filters=AlertFilterParams(is_active=True)
-            )
+            most_affected = get_most_affected_alerts(db, limit=5)
 
-            return BleachingAlertSummary(
+            summary = BleachingAlertSummary(
                 total_alerts=stats.get("total_alerts", 0),
                 active_alerts=stats.get("active_alerts", 0),
                 resolved_alerts=stats.get("resolved_alerts", 0),
@@ -506,10 +510,15 @@ class BleachingAlertService:
                 average_bleaching_percentage=stats.get(
                     "average_bleaching_percentage", 0.0
                 ),
-                most_affected_locations=[
-                    BleachingAlertOut.model_validate(alert) for alert in most_affected
-                ],
+                most_affected_locations=BleachingAlertListAdapter.validate_python(
+                    most_affected, from_attributes=True
+                ),
             )
+            # an empty stats dict means the aggregate failed; don't cache zeros
+            if stats:
+                cache_alert_summary(summary)
+
+            return summary
         except Exception as e:
             logger.error(f"{LOG_MSG} error getting alert summary: {str(e)}")
             raise HTTPException(
@@ -5,9 +5,9 @@ from datetime import datetime, timezone
 from fastapi import UploadFile, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from uuid import uuid4, UUID
+from uuid import UUID
 
-from app.core.supabase_client import supabase
+from app.core.supabase_client import get_supabase
 from app.crud.archived_image import store_archived_data
 from app.crud.coral_images import (
     save_analysis_results,
@@ -26,7 +26,7 @@ from app.crud.coral_images import (
     delete_selected_images,
     log_analytics_event,
 )
-from app.crud.user import get_user_by_id
+from app.crud.user import user_exists
 from app.schemas.archived_image import CreateArchivedImage
 from app.schemas.audit_trail import CreateAuditTrail
 from app.schemas.coral_image import CoralImageCreate, CoralImageOut, UpdateCoralImage
@@ -34,6 +34,7 @@ from app.schemas.user import UserOut
 from app.services.ai_inference import run_inference, run_llm_inference
 from app.services.audit_trail_service import audit_trail_service
 from app.services.bleaching_alert_service import bleaching_alert_service
+from app.services.image_processing import storage_filename
 
 logger = logging.getLogger(__name__)
 LOG_MSG = "Service:"
@@ -54,10 +55,12 @@ def upload_image_to_supabase_service(
     is_public: bool,
     user: UserOut,
 ):
-    unique_filename = f"{uuid4()}_{original_filename}"
+    unique_filename = storage_filename()
 
     try:
-        supabase.storage.from_("coral-images").upload(unique_filename, file_bytes)
+        get_supabase().storage.from_("coral-images").upload(
+            unique_filename, file_bytes
+        )
     except Exception as e:
         logger.error(f"{LOG_MSG} supabase upload failed: {str(e)}")
         raise HTTPException(
@@ -65,7 +68,9 @@ def upload_image_to_supabase_service(
             detail="image upload to supabase failed",
         )
 
-    file_url = supabase.storage.from_("coral-images").get_public_url(unique_filename)
+    file_url = (
+        get_supabase().storage.from_("coral-images").get_public_url(unique_filename)
+    )
 
     image_data = CoralImageCreate(
         user_id=user.id,
@@ -196,59 +201,61 @@ def upload_image_to_supabase_service(
         )
 
 
-def get_all_images_service(db: Session):
-    try:
-        all_images = get_all_images(db)
-
-        if not all_images:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="no image found"
-            )
+def get_all_images_service(
+    db: Session, limit: Optional[int] = None, offset: Optional[int] = 0
+):
+    all_images = get_all_images(db, limit=limit, offset=offset)
 
-        return all_images
-    except Exception as e:
-        logger.error(f"{LOG_MSG} error getting all images: {str(e)}")
+    if all_images is None:
+        logger.error(f"{LOG_MSG} error getting all images")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="getting images failed",
         )
 
+    if not all_images:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="no image found"
+        )
 
-def get_all_coral_data(db: Session) -> List[CoralImageOut]:
-    try:
-        all_data = get_all_images_with_results(db)
+    return all_images
 
-        if not all_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="no data found"
-            )
 
-        return all_data
-    except Exception as e:
-        logger.error(f"{LOG_MSG} error getting all coral data: {str(e)}")
+def get_all_coral_data(db: Session) -> List[CoralImageOut]:
+    all_data = get_all_images_with_results(db)
+
+    if all_data is None:
+        logger.error(f"{LOG_MSG} error getting all coral data")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="getting coral data failed.",
         )
 
+    if not all_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="no data found"
+        )
 
-def get_public_coral_data(db: Session) -> List[CoralImageOut]:
-    try:
-        data = get_public_images_with_results(db)
+    return all_data
 
-        if not data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="no data found"
-            )
 
-        return data
-    except Exception as e:
-        logger.error(f"{LOG_MSG} error getting all public data: {str(e)}")
+def get_public_coral_data(db: Session) -> List[CoralImageOut]:
+    data = get_public_images_with_results(db)
+
+    if data is None:
+        logger.error(f"{LOG_MSG} error getting all public data")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="getting public coral data failed.",
         )
 
+    if not data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="no data found"
+        )
+
+    return data
+
 
 def get_all_coral_locations(db: Session):
     try:
@@ -262,60 +269,53 @@ def get_all_coral_locations(db: Session):
 
 
 def get_image_for_user_service(db: Session, id: UUID):
-    try:
-        image_by_user = get_images_by_user(db, id)
+    image_by_user = get_images_by_user(db, id)
 
-        if not image_by_user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="images by user not found"
-            )
-
-        return image_by_user
-    except Exception as e:
-        logger.error(f"{LOG_MSG} error getting image by user: {str(e)}")
+    if image_by_user is None:
+        logger.error(f"{LOG_MSG} error getting image by user")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="getting images failed",
         )
 
+    if not image_by_user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="images by user not found"
+        )
+
+    return image_by_user
+
 
 def get_all_images_by_user_service(
     db: Session, id: UUID
 ) -> Optional[List[CoralImageOut]]:
-    try:
-        images = get_all_images_by_user(db, id)
-
-        if not images:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="no image by user found"
-            )
+    images = get_all_images_by_user(db, id)
 
-        return images
-    except Exception as e:
-        logger.error(f"{LOG_MSG} error getting images uploaded by user: {str(e)}")
+    if images is None:
+        logger.error(f"{LOG_MSG} error getting images uploaded by user")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="failed to get all images by user",
         )
 
+    if not images:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="no image by user found"
+        )
 
-def get_single_image_service(db: Session, id: UUID):
-    try:
-        image = get_image_by_id(db, id)
+    return images
 
-        if not image:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="image not found"
-            )
 
-        return image
-    except Exception as e:
-        logger.error(f"{LOG_MSG} error getting single image by id: {str(e)}")
+def get_single_image_service(db: Session, id: UUID):
+    image = get_image_by_id(db, id)
+
+    if not image:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="getting image failed",
+            status_code=status.HTTP_404_NOT_FOUND, detail="image not found"
         )
 
+    return image
+
 
 def edit_image_details(db: Session, id: UUID, payload: UpdateCoralImage):
     try:
@@ -335,14 +335,17 @@ def edit_image_details(db: Session, id: UUID, payload: UpdateCoralImage):
 
 def change_coral_image_publicity(db: Session, id: UUID, is_public: bool):
     try:
-        existing = get_image_by_id(db, id)
+        # a single UPDATE; no matched row means the image does not exist
+        updated = change_coral_image_public_status(db, id, is_public)
 
-        if not existing:
+        if not updated:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="image not found"
             )
 
-        return change_coral_image_public_status(db, id, is_public)
+        return updated
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"{LOG_MSG} error updating image publicity status: {str(e)}")
         raise HTTPException(
@@ -355,14 +358,14 @@ def change_all_user_coral_image_publicity_status(
     db: Session, user_id: UUID, is_public: bool
 ):
     try:
-        existing_user = get_user_by_id(db, user_id)
-
-        if not existing_user:
+        if not user_exists(db, user_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="user not found"
             )
 
         return change_all_user_coral_image_status(db, user_id, is_public)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             f"{LOG_MSG} error updating all image publicity status uploaded by user: {str(e)}"
@@ -411,7 +414,7 @@ def delete_single_image_service(db: Session, id: UUID, user: UserOut):
         )
 
     # try:
-    #     supabase.storage.from_("coral-images").remove([filename])
+    #     get_supabase().storage.from_("coral-images").remove([filename])
     # except Exception as e:
     #     logger.error(f"{LOG_MSG} error deleting image from supabase storage: {str(e)}")
     #     raise HTTPException(
@@ -440,20 +443,26 @@ def delete_single_image_service(db: Session, id: UUID, user: UserOut):
 
 
 def delete_multiple_images_service(db: Session, ids: List[UUID], user: UserOut) -> int:
-    images = [get_image_by_id(db, id) for id in ids]
-    filenames = [img.filename for img in images if img]
-
     try:
-        supabase.storage.from_("coral-images").remove(filenames)
+        filenames = delete_selected_images(db, ids)
     except Exception as e:
-        logger.error(
-            f"{LOG_MSG} error in deleting images from supabase storage: {str(e)}"
-        )
+        logger.error(f"{LOG_MSG} error deleting images from db: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Deleting images from storage failed",
+            detail="deleting images from db failed",
         )
 
+    if filenames:
+        try:
+            get_supabase().storage.from_("coral-images").remove(filenames)
+        except Exception as e:
+            # the rows are already deleted and committed, so report the files
+            # left behind instead of failing a request that did take effect
+            logger.error(
+                f"{LOG_MSG} images deleted from db but not from supabase storage, "
+                f"orphaned files: {filenames}: {str(e)}"
+            )
+
     audit = CreateAuditTrail(
         actor_id=user.id,
         actor_role=user.role,
@@ -463,11 +472,4 @@ def delete_multiple_images_service(db: Session, ids: List[UUID], user: UserOut)
     )
     audit_trail_service.insert_audit(db, audit)
 
-    try:
-        return delete_selected_images(db, ids)
-    except Exception as e:
-        logger.error(f"{LOG_MSG} error deleting images from db: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="deleting images from db failed",
-        )
+    return len(filenames)
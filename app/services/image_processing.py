@@ -3,8 +3,13 @@ import logging
 from fastapi import UploadFile, HTTPException, status
 from PIL import Image, UnidentifiedImageError
 from io import BytesIO
+from pathlib import PurePosixPath
+from uuid import uuid4
 
 
+ALLOWED_IMAGE_EXTENSIONS = frozenset({"png", "jpg", "jpeg"})
+STORAGE_IMAGE_EXTENSION = "jpg"
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024
 MAX_IMAGE_DIMENSION = 1024
 STORAGE_IMAGE_QUALITY = 85
 AI_IMAGE_SIZE = (512, 512)
@@ -15,6 +20,24 @@ LOG_MSG = "CRUD:"
 
 
 def validate_image(file: UploadFile) -> None:
+    extension = PurePosixPath(file.filename or "").suffix.lower().lstrip(".")
+    if extension not in ALLOWED_IMAGE_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="unsupported image type, use PNG or JPEG",
+        )
+
+    # the upload is already spooled to disk; check its size before decoding
+    file.file.seek(0, 2)
+    size = file.file.tell()
+    file.file.seek(0)
+
+    if size > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="image file too large",
+        )
+
     try:
         image = Image.open(file.file)
         image.verify()
@@ -28,16 +51,24 @@ def validate_image(file: UploadFile) -> None:
 def optimize_for_storage(file: UploadFile) -> bytes:
     try:
         image = Image.open(file.file)
+        # let the JPEG decoder scale down while decoding instead of
+        # materializing the full-resolution bitmap before resizing
+        image.draft("RGB", (MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION))
         image = image.convert("RGB")
         image.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION))
 
         buffer = BytesIO()
         image.save(buffer, format="JPEG", quality=STORAGE_IMAGE_QUALITY)
-        buffer.seek(0)
 
-        return buffer.read()
+        return buffer.getvalue()
     except Exception as e:
         logger.error(f"{LOG_MSG} failed to optimize image for storage: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="image processing failed",
+        )
+    finally:
+        file.file.seek(0)
 
 
 def prepare_for_ai(file: UploadFile) -> bytes:
@@ -80,3 +111,9 @@ def generate_thumbnail(file: UploadFile) -> bytes:
         )
     finally:
         file.file.seek(0)
+
+
+def storage_filename() -> str:
+    # every stored image is re-encoded as JPEG by optimize_for_storage, so the
+    # object key never needs the client's filename
+    return f"{uuid4().hex}.{STORAGE_IMAGE_EXTENSION}"
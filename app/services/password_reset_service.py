@@ -1,6 +1,8 @@
 import logging
 import secrets
 
+from datetime import datetime, timedelta, timezone
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
@@ -46,10 +48,9 @@ class PasswordResetService:
             bool: True if the reset process was initiated successfully, False otherwise.
         """
 
-        from datetime import datetime, timezone, timedelta
-
         try:
-            user = get_user_by_email(db, payload.email)
+            # CRUD calls use the sync Session, so keep them off the event loop
+            user = await run_in_threadpool(get_user_by_email, db, payload.email)
 
             if not user:
                 logger.info(
@@ -57,7 +58,7 @@ class PasswordResetService:
                 )
                 return False
 
-            cleanup_user_token(db, user.id)
+            await run_in_threadpool(cleanup_user_token, db, user.id)
 
             token = secrets.token_urlsafe(32)
             # current_time = datetime.now(timezone.utc)
@@ -65,7 +66,7 @@ class PasswordResetService:
                 minutes=settings.RESET_TOKEN_EXPIRE_MINUTES
             )
 
-            store_reset_token(db, user.id, token, expires_at)
+            await run_in_threadpool(store_reset_token, db, user.id, token, expires_at)
 
             reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token}"
 
@@ -131,7 +132,7 @@ class PasswordResetService:
         """
 
         try:
-            token_data = get_reset_token(db, payload.token)
+            token_data = await run_in_threadpool(get_reset_token, db, payload.token)
 
             if not token_data:
                 logger.warning(
@@ -139,19 +140,21 @@ class PasswordResetService:
                 )
                 return False
 
-            user = get_user_by_id(db, token_data.user_id)
+            user = await run_in_threadpool(get_user_by_id, db, token_data.user_id)
             if not user:
                 logger.error(f"Service: user not found for token: {payload.token}")
                 return False
 
-            password_hash = Hasher.hash_password(payload.new_password)
+            password_hash = await Hasher.hash_password_async(payload.new_password)
 
-            success = change_password(db, user.id, password_hash)
+            success = await run_in_threadpool(
+                change_password, db, user.id, password_hash
+            )
             if not success:
                 logger.error(f"Service: error updating password for: {user.email}")
                 return False
 
-            mark_reset_token_as_used(db, payload.token)
+            await run_in_threadpool(mark_reset_token_as_used, db, payload.token)
             await email_service.send_password_changed_confirmation(
                 user.email, user.name
             )
@@ -177,9 +180,9 @@ class PasswordResetService:
         """
 
         try:
-            deleted_account = cleanup_expired_token(db)
-            logger.info(f"Service: cleaned up {deleted_account} expired reset token")
-            return deleted_account
+            deleted_count = cleanup_expired_token(db)
+            logger.info(f"Service: cleaned up {deleted_count} expired reset token")
+            return deleted_count
         except Exception as e:
             logger.error(f"Service: error cleaning up expired tokens: {str(e)}")
             return 0
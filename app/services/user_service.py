@@ -1,21 +1,20 @@
 import logging
 
-from fastapi import Depends, HTTPException, status
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List, Dict
-from uuid import UUID, uuid4
+from typing import Dict, List, Optional
+from uuid import UUID
 
-from app.core.auth import require_role
 from app.core.security import Hasher
-from app.core.supabase_client import supabase
+from app.core.supabase_client import get_supabase
 from app.crud import user as user_crud
-from app.db.connection import get_db
-from app.models.users import UserRole
 from app.schemas.audit_trail import CreateAuditTrail
 from app.schemas.user import CreateUser, UpdateUser, UserOut
 from app.schemas.password_reset import PasswordChangeRequest
 from app.services.audit_trail_service import audit_trail_service
 from app.services.email_service import email_service
+from app.services.image_processing import storage_filename
 
 
 logger = logging.getLogger(__name__)
@@ -31,11 +30,22 @@ class UserService:
             user_data (CreateUser): Data required to create a user.
             db (Session): SQLAlchemy database session.
 
+        Raises:
+            HTTPException: If an account with the email already exists.
+
         Returns:
             dict: Success message indicating the user was created.
         """
 
-        user_crud.create_user(db, user_data, hashed_password=user_data.password)
+        user = user_crud.create_user(
+            db, user_data, hashed_password=user_data.password
+        )
+        # create_user inserts with ON CONFLICT DO NOTHING, so None is a duplicate
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="account already exists"
+            )
+
         return {"message": "Service: user successfully created"}
 
     def get_user_by_email_service(
@@ -72,18 +82,25 @@ class UserService:
         user_details = user_crud.get_user_by_id(db, id)
         return user_details
 
-    def get_all_users_service(self, db: Session) -> List[UserOut]:
+    def get_all_users_service(
+        self,
+        db: Session,
+        limit: Optional[int] = None,
+        after_id: Optional[UUID] = None,
+    ) -> List[UserOut]:
         """
-        Retrieves a list of all users.
+        Retrieves a page of users ordered by id.
 
         Args:
             db (Session): SQLAlchemy database session.
+            limit (Optional[int]): Maximum number of users to return.
+            after_id (Optional[UUID]): Id of the last user on the previous page.
 
         Returns:
-            list[UserOut]: A list of all users.
+            list[UserOut]: A list of users.
         """
 
-        return user_crud.get_all_users(db)
+        return user_crud.get_all_users(db, limit=limit, after_id=after_id)
 
     def get_all_admin_service(self, db: Session) -> List[UserOut]:
         all_admin = user_crud.get_all_admin(db)
@@ -96,7 +113,12 @@ class UserService:
         return all_admin
 
     def update_user_details_service(
-        self, db: Session, id: UUID, update_data: UpdateUser, user: UserOut
+        self,
+        db: Session,
+        id: UUID,
+        update_data: UpdateUser,
+        user: UserOut,
+        actor_id: Optional[UUID] = None,
     ) -> UserOut:
         """
         Updates user details for a given user ID.
@@ -105,12 +127,24 @@ class UserService:
             id (UUID): The UUID of the user to update.
             update_data (UpdateUser): Fields to update.
             db (Session): SQLAlchemy database session.
+            user (UserOut): The authenticated user performing the update.
+            actor_id (Optional[UUID]): When given, only that user's own row is
+                updated; the admin path leaves it unset.
+
+        Raises:
+            HTTPException: If actor_id is given and the target is not that user.
 
         Returns:
             dict: Success message indicating the user details were updated.
         """
 
-        updated_user = user_crud.update_user_details(db, id, update_data)
+        updated_user = user_crud.update_user_details(
+            db, id, update_data, actor_id=actor_id
+        )
+        if not updated_user and actor_id is not None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden method"
+            )
 
         audit = CreateAuditTrail(
             actor_id=user.id,
@@ -130,25 +164,25 @@ class UserService:
         db: Session,
         id: UUID,
         file_bytes: bytes,
-        original_filename: str,
         user: UserOut,
     ) -> Dict[str, str]:
-        unique_filename = f"{uuid4()}_{original_filename}"
+        unique_filename = storage_filename()
 
-        existing_user = self.get_user_by_id_service(db, id)
+        # only the old filename is needed, so skip hydrating the whole user
+        old_filename = user_crud.get_user_profile(db, id)
 
         try:
-            if existing_user and existing_user.profile:
-                old_filename = existing_user.profile
-
+            if old_filename:
                 try:
-                    supabase.storage.from_("profile-pictures").remove([old_filename])
+                    get_supabase().storage.from_("profile-pictures").remove(
+                        [old_filename]
+                    )
                 except Exception as e:
                     logger.warning(
                         f"{LOG_MSG} error deleting old profile picture from supabase: {str(e)}"
                     )
 
-            supabase.storage.from_("profile-pictures").upload(
+            get_supabase().storage.from_("profile-pictures").upload(
                 unique_filename, file_bytes
             )
         except Exception as e:
@@ -158,7 +192,7 @@ class UserService:
                 detail="failed to upload image to supabase",
             )
 
-        file_url = supabase.storage.from_("profile-pictures").get_public_url(
+        file_url = get_supabase().storage.from_("profile-pictures").get_public_url(
             unique_filename
         )
 
@@ -181,9 +215,7 @@ class UserService:
         self,
         db: Session,
         id: UUID,
-        user: UserOut = Depends(
-            require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-        ),
+        user: UserOut,
     ) -> Dict[str, str]:
         """
         Deletes a user by their UUID.
@@ -191,13 +223,21 @@ class UserService:
         Args:
             id (UUID): The UUID of the user to delete.
             db (Session): SQLAlchemy database session.
+            user (UserOut): The authenticated user; only their own row is deleted.
+
+        Raises:
+            HTTPException: If the target is not the authenticated user.
 
         Returns:
             dict: Success message indicating the user was deleted.
         """
 
         try:
-            user_crud.delete_user(db, id)
+            deleted = user_crud.delete_user(db, id, actor_id=user.id)
+            if not deleted:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden method"
+                )
 
             audit = CreateAuditTrail(
                 actor_id=user.id,
@@ -209,6 +249,8 @@ class UserService:
             )
             audit_trail_service.insert_audit(db, audit)
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"{LOG_MSG} error deleting user: {str(e)}")
             raise HTTPException(
@@ -223,9 +265,7 @@ class UserService:
         db: Session,
         id: UUID,
         payload: PasswordChangeRequest,
-        user: UserOut = Depends(
-            require_role([UserRole.USER, UserRole.ADMIN, UserRole.SUPER_ADMIN])
-        ),
+        user: UserOut,
     ) -> Dict[str, str]:
         """
         Changes a user's password after verifying the old password.
@@ -234,20 +274,27 @@ class UserService:
             id (UUID): The UUID of the user.
             payload (PasswordChangeRequest): Contains the old and new passwords.
             db (Session): SQLAlchemy database session.
+            user (UserOut): The authenticated user; only their own row is changed.
 
         Raises:
-            HTTPException: If user is not found or old password is incorrect.
+            HTTPException: If the old password is incorrect or the target is
+                not the authenticated user.
 
         Returns:
             dict: Success message indicating the password was changed.
         """
 
-        user = user_crud.get_user_by_id(db, id)
-
-        if not user:
-            raise HTTPException(status_code=404, detail="user not found")
+        # the cached current user is a UserOut without the hash; read just that,
+        # scoped to the caller so another user's hash is never compared against
+        hashed_password = await run_in_threadpool(
+            user_crud.get_password_hash, db, id, user.id
+        )
+        if not hashed_password:
+            raise HTTPException(status_code=400, detail="wrong password")
 
-        verify = Hasher.verify_password(payload.old_password, user.password)
+        verify = await Hasher.verify_password_async(
+            payload.old_password, hashed_password
+        )
 
         if not verify:
             raise HTTPException(status_code=400, detail="wrong password")
@@ -258,8 +305,14 @@ class UserService:
                 detail="new password and confirm new password does not match",
             )
 
-        hashed_pwd = Hasher.hash_password(payload.new_password)
-        user_crud.change_password(db, id, hashed_pwd)
+        hashed_pwd = await Hasher.hash_password_async(payload.new_password)
+        updated_user = await run_in_threadpool(
+            user_crud.change_password, db, id, hashed_pwd, user.id
+        )
+        if not updated_user:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden method"
+            )
 
         name = f"{user.first_name} {user.last_name}"
 
@@ -273,7 +326,7 @@ class UserService:
             resource_id=id,
             description=f"user with the email {user.email} changed their password",
         )
-        audit_trail_service.insert_audit(db, audit)
+        await run_in_threadpool(audit_trail_service.insert_audit, db, audit)
 
         return {"message": "Service: successfully changed password"}
 
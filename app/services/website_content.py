@@ -46,11 +46,17 @@ class WebsiteContentService:
                 detail="failed to get content with id.",
             )
 
-    def get_all_contents(self, db: Session) -> Optional[List[WebsiteContentOut]]:
+    def get_all_contents(
+        self,
+        db: Session,
+        limit: Optional[int] = None,
+        after_id: Optional[UUID] = None,
+    ) -> Optional[List[WebsiteContentOut]]:
         try:
-            all_content = select_all_content(db)
+            all_content = select_all_content(db, limit=limit, after_id=after_id)
 
-            if not all_content:
+            # None means the query failed; an empty page past the end is fine
+            if all_content is None:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="error getting all contents.",
@@ -88,7 +94,8 @@ class WebsiteContentService:
         self, db: Session, payload: WebsiteContentCreate, user: UserOut
     ) -> Dict[str, str]:
         try:
-            content = store_content(db, payload)
+            # the audit insert commits the content write in the same transaction
+            content = store_content(db, payload, commit=False)
 
             audit = CreateAuditTrail(
                 actor_id=user.id,
@@ -111,7 +118,7 @@ class WebsiteContentService:
         self, db: Session, id: UUID, payload: WebsiteContentUpdate, user: UserOut
     ) -> Dict[str, str]:
         try:
-            update(db, id, payload)
+            update(db, id, payload, commit=False)
 
             audit = CreateAuditTrail(
                 actor_id=user.id,
@@ -132,7 +139,7 @@ class WebsiteContentService:
 
     def remove_content(self, db: Session, id: UUID, user: UserOut) -> Dict[str, str]:
         try:
-            delete_content(db, id)
+            delete_content(db, id, commit=False)
 
             audit = CreateAuditTrail(
                 actor_id=user.id,
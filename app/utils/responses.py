@@ -0,0 +1,58 @@
+import hashlib
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+NEXT_CURSOR_HEADER = "X-Next-After-Id"
+
+
+def next_page_headers(rows: Sequence[Any], limit: Optional[int]) -> Dict[str, str]:
+    """
+    A full page may have more rows after it, so hand back the last id as the
+    after_id cursor for the next request; a short or unbounded page has none.
+    """
+    if limit and rows and len(rows) == limit:
+        return {NEXT_CURSOR_HEADER: str(rows[-1].id)}
+
+    return {}
+
+
+def json_list_response(
+    adapter: TypeAdapter,
+    rows: Iterable[Any],
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Validate ORM rows with a list TypeAdapter and encode them in one pass.
+
+    Returning a Response skips FastAPI's response_model re-validation and the
+    jsonable_encoder walk; the route's response_model still documents the shape.
+    """
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(rows, from_attributes=True)),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def etag_for(content: bytes) -> str:
+    return f'"{hashlib.blake2s(content).hexdigest()[:16]}"'
+
+
+def conditional_json_response(
+    request: Request,
+    etag: str,
+    content: bytes,
+    extra_headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Return pre-encoded JSON with its ETag, or an empty 304 when the client
+    already holds the same representation (If-None-Match).
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache", **(extra_headers or {})}
+
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -1,13 +1,56 @@
+import hashlib
+import hmac
 import logging
 
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Union
 from jose import JWTError, jwt
+from jose.backends.base import Key
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+HMAC_HASHES = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+class PreparedHMACKey(Key):
+    """
+    HMAC signing key whose key schedule is computed once per process.
+
+    jose rebuilds the HMAC (key padding plus ipad/opad passes) on every
+    encode/decode; copying an already keyed template skips that work.
+    """
+
+    def __init__(self, key: str, algorithm: str):
+        self._algorithm = algorithm
+        self._template = hmac.new(
+            key.encode("utf-8"), digestmod=HMAC_HASHES[algorithm]
+        )
+
+    def sign(self, msg: bytes) -> bytes:
+        signer = self._template.copy()
+        signer.update(msg)
+        return signer.digest()
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        return hmac.compare_digest(self.sign(msg), sig)
+
+
+def prepare_key(secret: str) -> Union[str, Key]:
+    if settings.ALGORITHM in HMAC_HASHES:
+        return PreparedHMACKey(secret, settings.ALGORITHM)
+
+    return secret
+
+
+access_token_key = prepare_key(settings.SECRET_KEY)
+refresh_token_key = prepare_key(settings.REFRESH_SECRET_KEY)
+
 
 class TokenSecurity:
     @staticmethod
@@ -41,7 +84,7 @@ class TokenSecurity:
                 }
             )
 
-        encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, settings.ALGORITHM)
+        encoded_jwt = jwt.encode(to_encode, access_token_key, settings.ALGORITHM)
 
         return encoded_jwt
 
@@ -62,9 +105,7 @@ class TokenSecurity:
             "iat": datetime.now(timezone.utc),
             "type": "refresh",
         }
-        encoded_jwt = jwt.encode(
-            to_encode, settings.REFRESH_SECRET_KEY, settings.ALGORITHM
-        )
+        encoded_jwt = jwt.encode(to_encode, refresh_token_key, settings.ALGORITHM)
 
         return encoded_jwt
 
@@ -72,7 +113,7 @@ class TokenSecurity:
     def decode_access_token(token: str) -> Optional[dict]:
         try:
             payload = jwt.decode(
-                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+                token, access_token_key, algorithms=[settings.ALGORITHM]
             )
 
             return payload